@@ -1,11 +1,6 @@
-from ovc.export.pipeline import run_pipeline
-from ovc.checks.geometry_quality import (
-    find_duplicate_geometries,
-    find_invalid_geometries,
-    find_unreasonable_areas,
-    compute_compactness,
-    find_min_road_distance_violations,
-)
+from __future__ import annotations
+
+import importlib
 
 __version__ = "3.2.0"
 __author__ = "Ammar Yasser Abdalazim"
@@ -18,3 +13,28 @@ __all__ = [
     "compute_compactness",
     "find_min_road_distance_violations",
 ]
+
+# The public names are imported on first access, so importing a light
+# submodule (ovc.core, ovc.precheck, ...) does not pull in the whole
+# building pipeline with folium and the checks.
+_LAZY_EXPORTS = {
+    "run_pipeline": "ovc.export.pipeline",
+    "find_duplicate_geometries": "ovc.checks.geometry_quality",
+    "find_invalid_geometries": "ovc.checks.geometry_quality",
+    "find_unreasonable_areas": "ovc.checks.geometry_quality",
+    "compute_compactness": "ovc.checks.geometry_quality",
+    "find_min_road_distance_violations": "ovc.checks.geometry_quality",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,7 @@ from ovc.checks.geometry_quality import (
     find_unreasonable_areas,
     compute_compactness,
     find_min_road_distance_violations,
+    run_geometry_quality_checks,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "find_unreasonable_areas",
     "compute_compactness",
     "find_min_road_distance_violations",
+    "run_geometry_quality_checks",
 ]
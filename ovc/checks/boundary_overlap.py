@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import shapely
+from geopandas.sindex import SpatialIndex
+
+from ovc.core.geometry import union_boundary
 from ovc.core.logging import get_logger
+from ovc.core.spatial_index import ensure_sindex
 
 
 def find_buildings_touching_boundary(
     buildings_metric: gpd.GeoDataFrame,
     boundary_metric: gpd.GeoDataFrame,
     boundary_buffer_m: float = 0.5,
+    sindex: SpatialIndex | None = None,
 ) -> gpd.GeoDataFrame:
     """Find buildings that touch or overlap the study area boundary.
 
@@ -22,6 +29,9 @@ def find_buildings_touching_boundary(
         Boundary polygon(s) in metric CRS.
     boundary_buffer_m : float
         Buffer distance (meters) around the boundary line.
+    sindex : SpatialIndex, optional
+        Pre-built spatial index over ``buildings_metric`` to reuse across
+        checks. Built (and cached on the frame) when omitted.
 
     Returns
     -------
@@ -37,17 +47,18 @@ def find_buildings_touching_boundary(
     if boundary_metric is None or boundary_metric.empty:
         return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
-    boundary_union = boundary_metric.union_all()
+    boundary_union = union_boundary(boundary_metric)
     boundary_line = getattr(boundary_union, "boundary", boundary_union)
 
-    buf = (
-        gpd.GeoSeries([boundary_line], crs=boundary_metric.crs)
-        .buffer(float(boundary_buffer_m))
-        .iloc[0]
-    )
+    buf = shapely.buffer(boundary_line, float(boundary_buffer_m), quad_segs=16)
+    # Prepare once so GEOS keeps an edge index on the (often very detailed)
+    # boundary buffer for every building tested against it
+    shapely.prepare(buf)
 
-    mask = buildings_metric.intersects(buf)
-    out = buildings_metric.loc[mask, ["bldg_id", "osmid", "geometry"]].copy()
+    hits = ensure_sindex(buildings_metric, sindex).query(buf, predicate="intersects")
+    mask = np.zeros(len(buildings_metric), dtype=bool)
+    mask[hits] = True
+    out = buildings_metric.loc[mask, ["bldg_id", "osmid", "geometry"]]
 
     out["error_type"] = "building_boundary_overlap"
     out["error_class"] = "boundary"
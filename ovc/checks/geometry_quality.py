@@ -11,12 +11,16 @@ New validation features:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import geopandas as gpd
 import numpy as np
-import pandas as pd
-from shapely.validation import explain_validity
+import shapely
+from geopandas.sindex import SpatialIndex
+from shapely.geometry.base import BaseGeometry
 
 from ovc.core.logging import get_logger
+from ovc.core.spatial_index import ensure_sindex, query_dwithin
 
 
 def find_duplicate_geometries(
@@ -45,18 +49,18 @@ def find_duplicate_geometries(
     if buildings_metric is None or buildings_metric.empty:
         return gpd.GeoDataFrame(geometry=[], crs=getattr(buildings_metric, "crs", None))
 
-    gdf = buildings_metric[["bldg_id", "geometry"]].copy()
-    gdf = gdf[gdf.geometry.notna() & ~gdf.geometry.is_empty].reset_index(drop=True)
+    geoms = buildings_metric.geometry.values
+    present = ~shapely.is_missing(geoms) & ~shapely.is_empty(geoms)
+    gdf = buildings_metric.loc[present, ["bldg_id", "geometry"]].reset_index(drop=True)
 
-    # Exact duplicates via WKB hash
-    gdf["_wkb"] = gdf.geometry.apply(lambda g: g.wkb_hex)
+    # Exact duplicates via WKB hash: serialize in one vectorized call and let
+    # pandas hash the raw bytes (no per-row hex strings)
+    gdf["_wkb"] = shapely.to_wkb(gdf.geometry.values)
     dup_mask = gdf.duplicated(subset="_wkb", keep=False)
-    duplicates = gdf[dup_mask].copy()
+    duplicates = gdf.loc[dup_mask, ["bldg_id", "geometry"]]
 
     duplicates["error_type"] = "duplicate_geometry"
     duplicates["error_class"] = "exact_duplicate"
-    duplicates = duplicates.drop(columns=["_wkb"])
-    gdf = gdf.drop(columns=["_wkb"])
 
     logger.info(f"Duplicate geometry check: {len(duplicates)} exact duplicates found")
     return duplicates
@@ -83,17 +87,20 @@ def find_invalid_geometries(
     if buildings_metric is None or buildings_metric.empty:
         return gpd.GeoDataFrame(geometry=[], crs=getattr(buildings_metric, "crs", None))
 
-    gdf = buildings_metric[["bldg_id", "geometry"]].copy()
-    gdf = gdf[gdf.geometry.notna() & ~gdf.geometry.is_empty].reset_index(drop=True)
+    geoms = buildings_metric.geometry.values
+    present = ~shapely.is_missing(geoms) & ~shapely.is_empty(geoms)
+    gdf = buildings_metric.loc[present, ["bldg_id", "geometry"]].reset_index(drop=True)
 
-    invalid_mask = ~gdf.geometry.is_valid
-    invalid = gdf[invalid_mask].copy()
+    # One GEOS pass yields both the validity flag and its reason
+    reasons = shapely.is_valid_reason(gdf.geometry.values)
+    invalid_mask = reasons != "Valid Geometry"
+    invalid = gdf.loc[invalid_mask, ["bldg_id", "geometry"]]
 
     if invalid.empty:
         logger.info("No invalid geometries found")
         return gpd.GeoDataFrame(geometry=[], crs=gdf.crs)
 
-    invalid["validity_reason"] = invalid.geometry.apply(lambda g: explain_validity(g))
+    invalid["validity_reason"] = reasons[invalid_mask]
     invalid["error_type"] = "invalid_geometry"
     invalid["error_class"] = "topology"
 
@@ -127,23 +134,23 @@ def find_unreasonable_areas(
     if buildings_metric is None or buildings_metric.empty:
         return gpd.GeoDataFrame(geometry=[], crs=getattr(buildings_metric, "crs", None))
 
-    gdf = buildings_metric[["bldg_id", "geometry"]].copy()
-    gdf["area_m2"] = gdf.geometry.area
-
-    too_small = gdf[gdf["area_m2"] < min_area_m2].copy()
-    too_small["error_class"] = "too_small"
-
-    too_large = gdf[gdf["area_m2"] > max_area_m2].copy()
-    too_large["error_class"] = "too_large"
-
-    result = pd.concat([too_small, too_large], ignore_index=True)
-    if result.empty:
-        return gpd.GeoDataFrame(geometry=[], crs=gdf.crs)
+    area = shapely.area(buildings_metric.geometry.values)
+    too_small = area < min_area_m2
+    too_large = area > max_area_m2
+    mask = too_small | too_large
+    if not mask.any():
+        return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
+    # Single boolean slice instead of two filtered copies + concat
+    result = buildings_metric.loc[mask, ["bldg_id", "geometry"]].reset_index(drop=True)
+    result["area_m2"] = area[mask]
+    result["error_class"] = np.where(too_small[mask], "too_small", "too_large")
     result["error_type"] = "unreasonable_area"
-    result = gpd.GeoDataFrame(result, geometry="geometry", crs=gdf.crs)
 
-    logger.info(f"Area check: {len(too_small)} too small, {len(too_large)} too large")
+    logger.info(
+        f"Area check: {int(too_small.sum())} too small, "
+        f"{int(too_large.sum())} too large"
+    )
     return result
 
 
@@ -174,30 +181,37 @@ def compute_compactness(
     if buildings_metric is None or buildings_metric.empty:
         return gpd.GeoDataFrame(geometry=[], crs=getattr(buildings_metric, "crs", None))
 
-    gdf = buildings_metric[["bldg_id", "geometry"]].copy()
-    area = gdf.geometry.area
-    perim = gdf.geometry.length
-    gdf["compactness"] = (4 * np.pi * area) / (perim**2 + 1e-12)
+    # Area and perimeter straight from the geometry array (GEOS C loop)
+    geoms = buildings_metric.geometry.values
+    area = shapely.area(geoms)
+    perim = shapely.length(geoms)
+    compactness = (4 * np.pi * area) / (perim**2 + 1e-12)
 
-    flagged = gdf[gdf["compactness"] < min_compactness].copy()
-    if flagged.empty:
-        return gpd.GeoDataFrame(geometry=[], crs=gdf.crs)
+    mask = compactness < min_compactness
+    if not mask.any():
+        return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
+
+    flagged = buildings_metric.loc[mask, ["bldg_id", "geometry"]]
+    flagged["compactness"] = compactness[mask]
 
     flagged["error_type"] = "low_compactness"
     flagged["error_class"] = "shape_quality"
 
     logger.info(f"Compactness check: {len(flagged)} buildings below {min_compactness}")
-    return gpd.GeoDataFrame(flagged, geometry="geometry", crs=gdf.crs)
+    return gpd.GeoDataFrame(flagged, geometry="geometry", crs=buildings_metric.crs)
 
 
 def find_min_road_distance_violations(
     buildings_metric: gpd.GeoDataFrame,
     roads_metric: gpd.GeoDataFrame,
     min_distance_m: float = 3.0,
+    sindex: SpatialIndex | None = None,
+    roads_union: BaseGeometry | None = None,
 ) -> gpd.GeoDataFrame:
     """Find buildings closer to the nearest road than the allowed minimum.
 
-    Uses spatial join with buffered roads for efficient pre-filtering.
+    Queries the buildings STRtree with a ``dwithin`` predicate around the
+    roads for efficient pre-filtering (buffered roads on GEOS < 3.10).
 
     Parameters
     ----------
@@ -207,6 +221,14 @@ def find_min_road_distance_violations(
         Roads (LineString/MultiLineString).
     min_distance_m : float
         Minimum allowed setback distance in meters.
+    sindex : SpatialIndex, optional
+        Pre-built spatial index over ``buildings_metric`` to reuse across
+        checks. Built (and cached on the frame) when omitted.
+    roads_union : Geometry, optional
+        Pre-computed road geometry to measure distances against instead of
+        the individual roads. By default each candidate's distance is the
+        minimum over the roads the index query paired it with, which is
+        much faster than measuring against one large geometry.
 
     Returns
     -------
@@ -224,32 +246,46 @@ def find_min_road_distance_violations(
         crs = getattr(buildings_metric, "crs", None)
         return gpd.GeoDataFrame(geometry=[], crs=crs)
 
-    # Buffer roads by min_distance and spatial-join
-    road_buf = roads_metric[["geometry"]].copy()
-    road_buf["geometry"] = road_buf.geometry.buffer(min_distance_m)
-
-    candidates = gpd.sjoin(
-        buildings_metric[["bldg_id", "geometry"]],
-        road_buf,
-        how="inner",
-        predicate="intersects",
+    # Query the buildings STRtree for anything within min_distance of a
+    # road, without materializing buffered road polygons where GEOS allows
+    road_pos, bldg_pos = query_dwithin(
+        ensure_sindex(buildings_metric, sindex),
+        roads_metric.geometry.values,
+        min_distance_m,
     )
 
-    if candidates.empty:
+    if len(bldg_pos) == 0:
         return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
-    # Compute actual nearest-road distance per building
-    unique_bids = candidates["bldg_id"].unique()
-    bldg_subset = buildings_metric[buildings_metric["bldg_id"].isin(unique_bids)].copy()
-
-    road_union = roads_metric.union_all()
-    bldg_subset["min_road_dist_m"] = bldg_subset.geometry.distance(road_union)
-
-    violations = bldg_subset[bldg_subset["min_road_dist_m"] < min_distance_m].copy()
-
-    if violations.empty:
+    if roads_union is not None:
+        candidates = np.unique(bldg_pos)
+        shapely.prepare(roads_union)
+        dist = shapely.distance(
+            buildings_metric.geometry.values[candidates], roads_union
+        )
+    else:
+        # Every road query_dwithin pairs with a building is within (about)
+        # min_distance of it and no nearer road is left out, so the
+        # nearest-road distance is the minimum over its pairs; far cheaper
+        # than measuring against one collection of all roads
+        pair_dist = shapely.distance(
+            roads_metric.geometry.values[road_pos],
+            buildings_metric.geometry.values[bldg_pos],
+        )
+        order = np.argsort(bldg_pos, kind="stable")
+        bldg_pos, pair_dist = bldg_pos[order], pair_dist[order]
+        starts = np.flatnonzero(np.r_[True, bldg_pos[1:] != bldg_pos[:-1]])
+        candidates = bldg_pos[starts]
+        dist = np.minimum.reduceat(pair_dist, starts)
+
+    close = dist < min_distance_m
+    if not close.any():
         return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
+    mask = np.zeros(len(buildings_metric), dtype=bool)
+    mask[candidates[close]] = True
+    violations = buildings_metric.loc[mask, ["bldg_id", "geometry"]]
+    violations["min_road_dist_m"] = dist[close]
     violations["error_type"] = "road_setback_violation"
     violations["error_class"] = "distance"
 
@@ -257,6 +293,59 @@ def find_min_road_distance_violations(
         f"Road setback check: {len(violations)} buildings within "
         f"{min_distance_m}m of roads"
     )
-    return violations[
-        ["bldg_id", "geometry", "min_road_dist_m", "error_type", "error_class"]
-    ]
+    return violations
+
+
+def run_geometry_quality_checks(
+    buildings_metric: gpd.GeoDataFrame,
+    roads_metric: gpd.GeoDataFrame | None = None,
+    min_area_m2: float = 4.0,
+    max_area_m2: float = 50000.0,
+    min_compactness: float = 0.2,
+    min_distance_m: float = 3.0,
+    max_workers: int | None = None,
+) -> dict[str, gpd.GeoDataFrame]:
+    """Run all geometry quality checks concurrently.
+
+    The checks are independent of each other and spend their time inside
+    Shapely 2.0 ufuncs, which release the GIL, so a thread pool runs them
+    in parallel without copying the buildings to worker processes.
+
+    Parameters
+    ----------
+    buildings_metric : GeoDataFrame
+        Buildings in metric CRS with ``bldg_id`` column.
+    roads_metric : GeoDataFrame, optional
+        Roads in metric CRS. The setback check is skipped when omitted.
+    min_area_m2, max_area_m2 : float
+        Area bounds for :func:`find_unreasonable_areas`.
+    min_compactness : float
+        Threshold for :func:`compute_compactness`.
+    min_distance_m : float
+        Setback for :func:`find_min_road_distance_violations`.
+    max_workers : int, optional
+        Thread pool size (defaults to one thread per check).
+
+    Returns
+    -------
+    dict
+        Mapping of ``error_type`` to the GeoDataFrame returned by each check.
+    """
+    tasks = {
+        "duplicate_geometry": (find_duplicate_geometries, (buildings_metric,)),
+        "invalid_geometry": (find_invalid_geometries, (buildings_metric,)),
+        "unreasonable_area": (
+            find_unreasonable_areas,
+            (buildings_metric, min_area_m2, max_area_m2),
+        ),
+        "low_compactness": (compute_compactness, (buildings_metric, min_compactness)),
+    }
+    if roads_metric is not None:
+        tasks["road_setback_violation"] = (
+            find_min_road_distance_violations,
+            (buildings_metric, roads_metric, min_distance_m),
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as pool:
+        futures = {name: pool.submit(fn, *args) for name, (fn, args) in tasks.items()}
+        return {name: fut.result() for name, fut in futures.items()}
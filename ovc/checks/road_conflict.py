@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import shapely
+from geopandas.sindex import SpatialIndex
+
 from ovc.core.logging import get_logger
+from ovc.core.spatial_index import bbox_prefilter, ensure_sindex
 
 
 def find_buildings_on_roads(
@@ -9,11 +14,14 @@ def find_buildings_on_roads(
     roads_metric: gpd.GeoDataFrame,
     road_buffer_m: float,
     min_intersection_area_m2: float,
+    sindex: SpatialIndex | None = None,
+    bounds: np.ndarray | None = None,
 ) -> gpd.GeoDataFrame:
     """Detect buildings that overlap with buffered road geometries.
 
-    Uses spatial-join pre-filtering against the buffered roads to avoid
-    the expensive full ``gpd.overlay`` on every building-road pair.
+    Queries the buildings STRtree with the buffered roads to pre-filter
+    candidates, avoiding the expensive full ``gpd.overlay`` on every
+    building-road pair.
 
     Parameters
     ----------
@@ -25,6 +33,12 @@ def find_buildings_on_roads(
         Buffer distance (meters) applied to roads.
     min_intersection_area_m2 : float
         Minimum overlap area to flag.
+    sindex : SpatialIndex, optional
+        Pre-built spatial index over ``buildings_metric`` to reuse across
+        checks. Built (and cached on the frame) when omitted.
+    bounds : ndarray, optional
+        Pre-computed ``(N, 4)`` bounds of ``buildings_metric`` (as returned
+        by ``shapely.bounds``), shared with the other building checks.
 
     Returns
     -------
@@ -47,57 +61,50 @@ def find_buildings_on_roads(
         f"{len(roads_metric)} roads, buffer={road_buffer_m}m"
     )
 
-    rb = roads_metric[["osmid", "geometry"]].copy()
-    rb["geometry"] = rb.geometry.buffer(float(road_buffer_m))
-
-    # Spatial join to narrow down candidates (fast STRtree lookup)
-    candidates = gpd.sjoin(
-        buildings_metric[["bldg_id", "geometry"]],
-        rb,
-        how="inner",
-        predicate="intersects",
+    road_buffers = shapely.buffer(
+        roads_metric.geometry.values, float(road_buffer_m), quad_segs=16
     )
 
-    if candidates.empty:
+    # Query the buildings STRtree with the road buffers to narrow down
+    # candidates; the tree is shared with the other building checks.
+    tree = ensure_sindex(buildings_metric, sindex)
+    road_pos, bldg_pos = tree.query(road_buffers, predicate="intersects")
+
+    # The bbox overlap bounds the intersection area; drop pairs that cannot
+    # reach the threshold before computing exact intersections.
+    if bounds is None:
+        bounds = shapely.bounds(buildings_metric.geometry.values)
+    road_bounds = shapely.bounds(road_buffers)
+    min_area = float(min_intersection_area_m2)
+    bbox_ok = bbox_prefilter(bounds, road_bounds, bldg_pos, road_pos, min_area)
+    bldg_pos, road_pos = bldg_pos[bbox_ok], road_pos[bbox_ok]
+
+    if len(bldg_pos) == 0:
         return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
-    # Only compute exact intersection for candidate pairs
-    rows = []
-    bldg_geoms = buildings_metric.set_index("bldg_id")["geometry"]
-    road_buf_geoms = rb.set_index(rb.index)["geometry"]
-
-    for _, row in candidates.iterrows():
-        bldg_id = row["bldg_id"]
-        road_idx = row["index_right"]
-        bg = bldg_geoms.loc[bldg_id] if bldg_id in bldg_geoms.index else None
-        rg = road_buf_geoms.iloc[road_idx] if road_idx < len(road_buf_geoms) else None
-
-        if bg is None or rg is None:
-            continue
-
-        inter = bg.intersection(rg)
-        if inter is None or inter.is_empty:
-            continue
-
-        area = inter.area
-        if area >= float(min_intersection_area_m2):
-            rows.append(
-                {
-                    "bldg_id": bldg_id,
-                    "osmid": row["osmid"],
-                    "inter_area_m2": float(area),
-                    "error_type": "building_on_road",
-                    "geometry": inter,
-                }
-            )
-
-    if not rows:
-        return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
+    order = np.lexsort((road_pos, bldg_pos))
+    bldg_pos, road_pos = bldg_pos[order], road_pos[order]
 
-    import pandas as pd
+    # Only compute exact intersection for candidate pairs, in one GEOS call
+    inter = shapely.intersection(
+        buildings_metric.geometry.values[bldg_pos], road_buffers[road_pos]
+    )
+    area = shapely.area(inter)
+    keep = ~shapely.is_empty(inter) & (area >= min_area)
+
+    if not keep.any():
+        return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
 
     result = gpd.GeoDataFrame(
-        pd.DataFrame(rows), geometry="geometry", crs=buildings_metric.crs
+        {
+            "bldg_id": buildings_metric["bldg_id"].values[bldg_pos[keep]],
+            "osmid": roads_metric["osmid"].values[road_pos[keep]],
+            "inter_area_m2": area[keep].astype(float),
+            "error_type": "building_on_road",
+            "geometry": inter[keep],
+        },
+        geometry="geometry",
+        crs=buildings_metric.crs,
     )
     logger.info(f"Found {len(result)} building-road conflicts")
     return result
@@ -110,7 +117,11 @@ def build_road_conflict_buildings_layer(
     if conflicts is None or conflicts.empty:
         return gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
     ids = set(conflicts["bldg_id"].astype(int).tolist())
-    sub = buildings_metric[buildings_metric["bldg_id"].astype(int).isin(ids)].copy()
+    # take() returns a new frame, so no extra .copy() is needed before
+    # adding the columns below
+    sub = buildings_metric.take(
+        np.flatnonzero(buildings_metric["bldg_id"].astype(int).isin(ids))
+    )
     sub["error_type"] = "building_on_road"
     sub["overlap_class"] = "n/a"
     return sub
@@ -18,10 +18,18 @@ class RoadConflictThresholds:
     min_intersection_area_m2: float = 0.5
 
 
+@dataclass(frozen=True)
+class WebMapConfig:
+    # Layers with at least this many features are written as GeoJSON next to
+    # the HTML instead of being embedded; None keeps the map self-contained.
+    sidecar_min_features: int | None = None
+
+
 @dataclass(frozen=True)
 class Config:
     overlap: OverlapConfig = OverlapConfig()
     road_conflict: RoadConflictThresholds = RoadConflictThresholds()
+    webmap: WebMapConfig = WebMapConfig()
 
 
 DEFAULT_CONFIG = Config()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 import geopandas as gpd
-from pyproj import CRS
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
 
 
 @dataclass(frozen=True)
@@ -10,20 +13,87 @@ class CRSResult:
     crs_metric: CRS
 
 
+@lru_cache(maxsize=None)
+def _epsg(code: int) -> CRS:
+    # Parsing the PROJ database per call is measurable in tiled runs; the
+    # handful of codes used here (4326, 3857, UTM zones) are cached.
+    return CRS.from_epsg(code)
+
+
 def choose_utm_crs_from_gdf(gdf_4326: gpd.GeoDataFrame) -> CRS:
     if gdf_4326 is None or gdf_4326.empty:
-        return CRS.from_epsg(3857)
-    c = gdf_4326.union_all().centroid
-    lon, lat = float(c.x), float(c.y)
+        return _epsg(3857)
+    # The union centroid is weighted by the highest dimension present: area
+    # for polygons, length for lines, a plain mean for points. Weighting the
+    # per-feature centroids the same way gives it without building the union
+    # (exactly so for non-overlapping features).
+    geoms = gdf_4326.geometry.values
+    centroids = shapely.centroid(geoms)
+    x, y = shapely.get_x(centroids), shapely.get_y(centroids)
+    ok = np.isfinite(x) & np.isfinite(y)
+    if not ok.any():
+        return _epsg(3857)
+    weights = shapely.area(geoms)[ok]
+    if weights.sum() <= 0:
+        weights = shapely.length(geoms)[ok]
+    if weights.sum() <= 0:
+        weights = None
+    lon = float(np.average(x[ok], weights=weights))
+    lat = float(np.average(y[ok], weights=weights))
     zone = int((lon + 180) // 6) + 1
     zone = max(1, min(zone, 60))  # Clamp to valid UTM zone range
     epsg = 32600 + zone if lat >= 0 else 32700 + zone
-    return CRS.from_epsg(epsg)
+    return _epsg(epsg)
+
+
+@lru_cache(maxsize=64)
+def _transformer(src: CRS, dst: CRS) -> Transformer:
+    return Transformer.from_crs(src, dst, always_xy=True)
+
+
+def to_crs(gdf: gpd.GeoDataFrame, crs) -> gpd.GeoDataFrame:
+    """Reproject a GeoDataFrame with a single PROJ call over all vertices.
+
+    Coordinates of the whole geometry column are flattened with
+    ``shapely.get_coordinates``, transformed in one vectorized
+    ``Transformer.transform`` call (transformers are cached per CRS pair)
+    and written back with ``shapely.set_coordinates``. Z values go through
+    the same call when every geometry is 3D; frames mixing 2D and 3D
+    geometries fall back to :meth:`GeoDataFrame.to_crs`.
+
+    Raises
+    ------
+    ValueError
+        If the GeoDataFrame has no CRS defined.
+    """
+    dst = CRS.from_user_input(crs)
+    if gdf.crs is None:
+        raise ValueError("Cannot transform naive geometries. Please set a crs first.")
+    if gdf.crs.is_exact_same(dst):
+        return gdf.copy()
+
+    geoms = np.asarray(gdf.geometry.values)
+    has_z = shapely.has_z(geoms)
+    if has_z.any() and not has_z.all():
+        return gdf.to_crs(dst)
+
+    transformer = _transformer(gdf.crs, dst)
+    if has_z.any():
+        coords = shapely.get_coordinates(geoms, include_z=True)
+        out = transformer.transform(coords[:, 0], coords[:, 1], coords[:, 2])
+    else:
+        coords = shapely.get_coordinates(geoms)
+        out = transformer.transform(coords[:, 0], coords[:, 1])
+    projected = shapely.set_coordinates(geoms.copy(), np.column_stack(out))
+    return gdf.set_geometry(projected, crs=dst)
 
 
 def ensure_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """Reproject a GeoDataFrame to WGS 84 (EPSG:4326).
 
+    Frames already in WGS 84 are returned as-is, without copying or
+    reprojecting the geometries.
+
     Raises
     ------
     ValueError
@@ -40,11 +110,13 @@ def ensure_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
             "Set the CRS in your source file (e.g. via QGIS or ogr2ogr), "
             "or run 'geoqa profile <file>' to diagnose the issue."
         )
-    return gdf.to_crs(4326)
+    if gdf.crs.equals(_epsg(4326)):
+        return gdf
+    return to_crs(gdf, _epsg(4326))
 
 
 def get_crs_pair(boundary_gdf: gpd.GeoDataFrame) -> CRSResult:
     boundary_4326 = ensure_wgs84(boundary_gdf)
     return CRSResult(
-        crs_wgs84=CRS.from_epsg(4326), crs_metric=choose_utm_crs_from_gdf(boundary_4326)
+        crs_wgs84=_epsg(4326), crs_metric=choose_utm_crs_from_gdf(boundary_4326)
     )
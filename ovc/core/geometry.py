@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry.base import BaseGeometry
+
 from ovc.core.logging import get_logger
 
 
-def drop_empty_and_fix(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+def drop_empty_and_fix(
+    gdf: gpd.GeoDataFrame, geom_types: tuple[str, ...] | None = None
+) -> gpd.GeoDataFrame:
     """Remove null/empty geometries and attempt to fix invalid ones.
 
     Parameters
     ----------
     gdf : GeoDataFrame
         Input data.
+    geom_types : tuple of str, optional
+        If given, also drop features whose geometry type (before fixing) is
+        not one of these, e.g. ``("Polygon", "MultiPolygon")``.
 
     Returns
     -------
@@ -19,18 +29,57 @@ def drop_empty_and_fix(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     if gdf is None or gdf.empty:
         return gpd.GeoDataFrame(geometry=[], crs=4326)
-    gdf = gdf[gdf.geometry.notna()].copy()
-    if gdf.empty:
+    geoms = np.asarray(gdf.geometry.values)
+    keep = ~shapely.is_missing(geoms)
+    if geom_types is not None:
+        type_ids = [shapely.GeometryType[t.upper()] for t in geom_types]
+        keep &= np.isin(shapely.get_type_id(geoms), type_ids)
+    if not keep.any():
         return gpd.GeoDataFrame(geometry=[], crs=gdf.crs)
-    try:
-        gdf["geometry"] = gdf.geometry.make_valid()
-    except Exception:
-        pass
-    # Drop any remaining empty geometries after make_valid
-    gdf = gdf[~gdf.geometry.is_empty].copy()
+    idx = np.flatnonzero(keep)
+    geoms = geoms[idx]
+    # Only invalid geometries go through make_valid
+    invalid = ~shapely.is_valid(geoms)
+    if invalid.any():
+        try:
+            geoms[invalid] = shapely.make_valid(geoms[invalid])
+        except Exception:
+            pass
+    # Empty inputs and anything emptied by make_valid go in one slice
+    nonempty = ~shapely.is_empty(geoms)
+    gdf = gdf.take(idx[nonempty])
+    gdf["geometry"] = geoms[nonempty]
     return gdf
 
 
+def renumber_rows(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Give ``gdf`` a fresh ``RangeIndex`` in place and return it.
+
+    Same result as ``reset_index(drop=True)``, without copying every column
+    of a frame that the loaders' filters have just built.
+    """
+    gdf.index = pd.RangeIndex(len(gdf))
+    return gdf
+
+
+def union_boundary(boundary: gpd.GeoDataFrame) -> BaseGeometry:
+    """Union the parts of a boundary layer into a single geometry.
+
+    Administrative boundaries are usually planar coverages (adjacent,
+    non-overlapping polygons). When the parts form a valid coverage they
+    are merged with GEOS ``CoverageUnion``, which only has to drop shared
+    edges; anything else falls back to the general ``union_all``.
+    """
+    geoms = boundary.geometry.values
+    if len(geoms) > 1 and hasattr(shapely, "coverage_is_valid"):
+        try:
+            if shapely.coverage_is_valid(geoms):
+                return shapely.coverage_union_all(geoms)
+        except Exception:
+            pass
+    return boundary.union_all()
+
+
 def clip_to_boundary(
     gdf: gpd.GeoDataFrame, boundary: gpd.GeoDataFrame
 ) -> gpd.GeoDataFrame:
@@ -52,10 +101,21 @@ def clip_to_boundary(
         return gdf
     if boundary is None or boundary.empty:
         return gdf
-    boundary_union = boundary.union_all()
+    boundary_union = union_boundary(boundary)
     try:
-        out = gdf[gdf.intersects(boundary_union)].copy()
-        out["geometry"] = out.geometry.intersection(boundary_union)
+        # STRtree candidates instead of testing every feature against the
+        # boundary; sorted to keep the input row order
+        idx = np.sort(gdf.sindex.query(boundary_union, predicate="intersects"))
+        out = gdf.take(idx)
+        # prepared once so the containment test below does not rebuild the
+        # boundary's edge index per feature; features strictly inside the
+        # boundary are kept as-is and only the edge-crossing ones are overlaid
+        shapely.prepare(boundary_union)
+        geoms = out.geometry.values
+        crossing = ~shapely.contains_properly(boundary_union, geoms)
+        clipped = np.asarray(geoms).copy()
+        clipped[crossing] = shapely.intersection(geoms[crossing], boundary_union)
+        out["geometry"] = gpd.GeoSeries(clipped, index=out.index, crs=gdf.crs)
         out = out[out.geometry.notna() & ~out.geometry.is_empty].copy()
         return out
     except Exception:
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def as_str_ids(values) -> np.ndarray:
+    """Format ids as an object array of ``str`` (same values as ``astype(str)``).
+
+    Integer ids go through ``int.__str__`` on a plain list, which skips
+    pandas' per-element boxing and is the common case for OSM ids.
+    """
+    if isinstance(getattr(values, "dtype", None), pd.api.extensions.ExtensionDtype):
+        # Nullable and categorical ids: np.asarray would turn Int64 NA into
+        # NaN floats ('1.0'/'nan'); pandas formats them as '1'/'<NA>'
+        return np.asarray(values.astype(str), dtype=object)
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return np.array(list(map(str, values.tolist())), dtype=object)
+    return values.astype(str).astype(object)
@@ -3,5 +3,5 @@ import logging
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
 
-def get_logger(name: str = "ovc"):
+def get_logger(name: str = "ovc") -> logging.Logger:
     return logging.getLogger(name)
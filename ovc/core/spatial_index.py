@@ -1,11 +1,77 @@
 from __future__ import annotations
 import geopandas as gpd
+import numpy as np
+import shapely
+from geopandas.sindex import SpatialIndex
 
 
-def ensure_sindex(gdf: gpd.GeoDataFrame):
+def ensure_sindex(
+    gdf: gpd.GeoDataFrame, sindex: SpatialIndex | None = None
+) -> SpatialIndex:
     """Build or return the spatial index (STRtree) for a GeoDataFrame.
 
-    GeoPandas lazily builds the spatial index on first access.
-    Calling this explicitly ensures it is ready before query loops.
+    GeoPandas lazily builds the spatial index on first access and caches it
+    on the geometry array, so repeated calls on the *same* frame are free.
+    Column selections and ``.copy()`` drop that cache, which is why checks
+    accept a pre-built ``sindex`` and pass it through here: when given, it
+    is returned as-is and must index ``gdf``'s geometries positionally.
     """
+    if sindex is not None:
+        return sindex
     return gdf.sindex
+
+
+def query_dwithin(tree, geoms, distance: float) -> np.ndarray:
+    """Pairs of ``geoms`` and indexed geometries at most ``distance`` apart.
+
+    ``tree`` is a shapely ``STRtree`` or a GeoPandas ``SpatialIndex``; the
+    result is its ``(2, K)`` array of input and tree positions. GEOS builds
+    older than 3.10 lack the ``dwithin`` predicate, so those query with the
+    buffered geometries instead.
+    """
+    if shapely.geos_version >= (3, 10, 0):
+        return tree.query(geoms, predicate="dwithin", distance=distance)
+    return tree.query(
+        shapely.buffer(geoms, distance, quad_segs=16), predicate="intersects"
+    )
+
+
+def bbox_overlap_area(bounds_a: np.ndarray, bounds_b: np.ndarray) -> np.ndarray:
+    """Area of the intersection of aligned ``(N, 4)`` bounding boxes.
+
+    This is an upper bound on the true intersection area of the underlying
+    geometries, so pairs whose bbox overlap is already below an area
+    threshold can be dropped without calling GEOS.
+    """
+    dx = np.minimum(bounds_a[:, 2], bounds_b[:, 2]) - np.maximum(
+        bounds_a[:, 0], bounds_b[:, 0]
+    )
+    dy = np.minimum(bounds_a[:, 3], bounds_b[:, 3]) - np.maximum(
+        bounds_a[:, 1], bounds_b[:, 1]
+    )
+    return np.clip(dx, 0, None) * np.clip(dy, 0, None)
+
+
+def bbox_prefilter(
+    bounds_a: np.ndarray,
+    bounds_b: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    min_area: float,
+    chunk_size: int = 1_000_000,
+) -> np.ndarray:
+    """Boolean mask of candidate pairs whose bbox overlap reaches ``min_area``.
+
+    ``idx_a``/``idx_b`` index positionally into ``bounds_a``/``bounds_b``
+    (typically the two rows of an ``sindex.query`` result). The pairs are
+    gathered and tested in chunks so that very large candidate lists do
+    not materialise full ``(K, 4)`` temporaries.
+    """
+    keep = np.empty(len(idx_a), dtype=bool)
+    for start in range(0, len(idx_a), chunk_size):
+        stop = start + chunk_size
+        keep[start:stop] = (
+            bbox_overlap_area(bounds_a[idx_a[start:stop]], bounds_b[idx_b[start:stop]])
+            >= min_area
+        )
+    return keep
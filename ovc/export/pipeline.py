@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 
 from ovc.core.logging import get_logger
 from ovc.core.config import DEFAULT_CONFIG
-from ovc.core.crs import get_crs_pair
+from ovc.core.crs import get_crs_pair, to_crs
+from ovc.core.ids import as_str_ids
+from ovc.core.geometry import union_boundary
+from ovc.core.spatial_index import ensure_sindex
 from ovc.loaders.boundaries import load_boundary_shapefile
 from ovc.loaders.buildings import load_buildings
 from ovc.loaders.roads import load_roads
@@ -34,13 +40,51 @@ class PipelineOutputs:
 
 def _ensure_osmid(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     if "osmid" not in gdf.columns:
-        gdf = gdf.copy()
-        gdf["osmid"] = gdf.index.astype(str)
-    else:
-        gdf["osmid"] = gdf["osmid"].astype(str)
+        # shallow: the new column must not leak into the caller's frame,
+        # but the existing columns need not be duplicated
+        gdf = gdf.copy(deep=False)
+        gdf["osmid"] = as_str_ids(gdf.index)
+    elif not (
+        gdf["osmid"].dtype == object
+        and pd.api.types.infer_dtype(gdf["osmid"], skipna=False) == "string"
+    ):
+        # Already-str columns (e.g. the concatenated error layers) are kept
+        gdf["osmid"] = as_str_ids(gdf["osmid"])
     return gdf
 
 
+def _select_buildings(
+    buildings_metric: gpd.GeoDataFrame, bldg_ids, exclude: bool = False
+) -> gpd.GeoDataFrame:
+    """Rows of ``buildings_metric`` whose ``bldg_id`` is in ``bldg_ids``.
+
+    ``bldg_id`` is the positional index assigned in :func:`run_pipeline`,
+    so membership is a numpy mask over positions instead of an ``isin``
+    hash of every building. With ``exclude=True`` the complement is
+    returned.
+    """
+    mask = np.zeros(len(buildings_metric), dtype=bool)
+    mask[np.asarray(bldg_ids, dtype=np.int64)] = True
+    if exclude:
+        mask = ~mask
+    return buildings_metric.take(np.flatnonzero(mask))
+
+
+def _with_wgs84_geometry(
+    layer_metric: gpd.GeoDataFrame, buildings_4326: gpd.GeoDataFrame
+) -> gpd.GeoDataFrame:
+    """Swap a building layer's metric geometry for the original EPSG:4326 one.
+
+    Every output building layer holds whole footprints keyed by the
+    positional ``bldg_id``, so the WGS 84 geometry can be taken from
+    ``buildings_4326`` instead of reprojecting back from the metric CRS.
+    """
+    if layer_metric.empty or "bldg_id" not in layer_metric.columns:
+        return to_crs(layer_metric, 4326)
+    pos = layer_metric["bldg_id"].to_numpy(dtype=np.int64)
+    return layer_metric.set_geometry(buildings_4326.geometry.values[pos], crs=4326)
+
+
 def _merge_errors(*layers: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     layers = [g for g in layers if g is not None and not g.empty]
     if not layers:
@@ -57,12 +101,21 @@ def _merge_errors(*layers: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         )
 
     crs = layers[0].crs
-    df = pd.concat(layers, ignore_index=True)
-    out = gpd.GeoDataFrame(df, crs=crs)
+    cols = ["osmid", "bldg_id", "error_type", "error_class", "geometry"]
+    # Concatenate only the output columns, without copying the inputs again
+    df = pd.concat(
+        [g[[c for c in cols if c in g.columns]] for g in layers],
+        ignore_index=True,
+        copy=False,
+    )
+    # Drop repeated (bldg_id, error_type) rows first so osmid is only
+    # normalised for the rows that are kept
+    keep = ~df.duplicated(subset=["bldg_id", "error_type"])
+    out = gpd.GeoDataFrame(df.loc[keep, list(df.columns)], geometry="geometry", crs=crs)
 
     out = _ensure_osmid(out)
-    out = out[["osmid", "bldg_id", "error_type", "error_class", "geometry"]]
-    out = out.drop_duplicates(subset=["bldg_id", "error_type"])
+    if list(out.columns) != cols:
+        out = out[cols]
 
     return out
 
@@ -130,105 +183,152 @@ def run_pipeline(
     if boundary_path is not None:
         boundary = load_boundary_shapefile(boundary_path)
         crs_pair = get_crs_pair(boundary.gdf_4326)
-        boundary_union_4326 = boundary.gdf_4326.union_all()
+        boundary_union_4326 = union_boundary(boundary.gdf_4326)
+        # prepared in place: the containment query below picks it up instead
+        # of preparing a temporary copy of the boundary
+        shapely.prepare(boundary_union_4326)
         boundary_name = boundary.name
         boundary_4326_for_outputs = boundary.gdf_4326
-        boundary_metric_for_checks = boundary.gdf_4326.to_crs(crs_pair.crs_metric)[
+        boundary_metric_for_checks = to_crs(boundary.gdf_4326, crs_pair.crs_metric)[
             ["geometry"]
         ]
     else:
         boundary_4326_for_outputs = None
 
-    # --- Load buildings (required) ---
-    buildings_4326 = load_buildings(buildings_path)
-    buildings_4326 = buildings_4326.reset_index(drop=True)
-    buildings_4326 = _ensure_osmid(buildings_4326)
-
-    if boundary is None:
-        crs_pair = get_crs_pair(buildings_4326)
-        boundary_4326_for_outputs = gpd.GeoDataFrame(
-            geometry=[buildings_4326.union_all()],
-            crs=4326,
-        )
-
-    buildings_metric = buildings_4326.to_crs(crs_pair.crs_metric).copy()
-    buildings_metric["bldg_id"] = buildings_metric.index.astype(int)
-    buildings_metric["osmid"] = buildings_4326["osmid"].values
-
-    # --- Load roads (optional) ---
-    if roads_path is not None:
-        roads_4326 = load_roads(
-            roads_path,
-            boundary_4326=boundary.gdf_4326 if boundary else None,
-        )
-    else:
-        roads_4326 = gpd.GeoDataFrame(geometry=[], crs=4326)
-        log.info("No roads file provided — road conflict checks will be skipped")
+    # --- Load buildings (required) and roads (optional) ---
+    # Both reads spend their time in OGR, which releases the GIL, so the
+    # roads file is read in the background while the buildings load.
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        roads_future = None
+        if roads_path is not None:
+            roads_future = loader.submit(
+                load_roads,
+                roads_path,
+                boundary_4326=boundary.gdf_4326 if boundary else None,
+            )
+        else:
+            log.info("No roads file provided — road conflict checks will be skipped")
+
+        # load_buildings already returns a 0..n-1 index, which bldg_id uses
+        buildings_4326 = load_buildings(buildings_path)
+        buildings_4326 = _ensure_osmid(buildings_4326)
+
+        if boundary is None:
+            crs_pair = get_crs_pair(buildings_4326)
+            boundary_4326_for_outputs = gpd.GeoDataFrame(
+                # Extent box for the outputs; a union of every footprint is
+                # costly and only used for display
+                geometry=[shapely.box(*buildings_4326.total_bounds)],
+                crs=4326,
+            )
+
+        buildings_metric = to_crs(buildings_4326, crs_pair.crs_metric)
+        buildings_metric["bldg_id"] = buildings_metric.index.astype(int)
+        buildings_metric["osmid"] = buildings_4326["osmid"].values
+
+        if roads_future is not None:
+            roads_4326 = roads_future.result()
+        else:
+            roads_4326 = gpd.GeoDataFrame(geometry=[], crs=4326)
 
     roads_4326 = _ensure_osmid(roads_4326)
-    roads_metric = roads_4326.to_crs(crs_pair.crs_metric)
+    roads_metric = to_crs(roads_4326, crs_pair.crs_metric)
 
     # --- Run checks ---
-    overlaps_metric = find_building_overlaps(buildings_metric, config.overlap)
-
-    overlap_buildings_metric = gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
-    if overlaps_metric is not None and not overlaps_metric.empty:
-        sev = {"sliver": 1, "partial": 2, "duplicate": 3}
-        inv = {1: "sliver", 2: "partial", 3: "duplicate"}
+    # One STRtree and one bounds array over the buildings, shared by every
+    # building check instead of being rebuilt per check. The checks get
+    # buildings_metric itself: column selections would copy the frame and
+    # drop the cached tree.
+    buildings_sindex = ensure_sindex(buildings_metric)
+    buildings_bounds = shapely.bounds(buildings_metric.geometry.values)
+    # Built up front too, so no worker races on lazy tree construction
+    buildings_4326_sindex = (
+        ensure_sindex(buildings_4326) if boundary_union_4326 is not None else None
+    )
 
-        a = overlaps_metric[["bldg_a", "overlap_type"]].rename(
-            columns={"bldg_a": "bldg_id"}
+    # The checks share no mutable state and spend their time in GEOS calls
+    # that release the GIL, so they run side by side on a thread pool.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        overlaps_future = pool.submit(
+            find_building_overlaps,
+            buildings_metric,
+            config.overlap,
+            sindex=buildings_sindex,
+            bounds=buildings_bounds,
         )
-        b = overlaps_metric[["bldg_b", "overlap_type"]].rename(
-            columns={"bldg_b": "bldg_id"}
+        road_future = None
+        if not roads_metric.empty:
+            road_future = pool.submit(
+                find_buildings_on_roads,
+                buildings_metric=buildings_metric,
+                roads_metric=roads_metric,
+                road_buffer_m=config.road_conflict.road_buffer_m,
+                min_intersection_area_m2=config.road_conflict.min_intersection_area_m2,
+                sindex=buildings_sindex,
+                bounds=buildings_bounds,
+            )
+        boundary_future = None
+        if boundary_metric_for_checks is not None:
+            boundary_future = pool.submit(
+                find_buildings_touching_boundary,
+                buildings_metric=buildings_metric,
+                boundary_metric=boundary_metric_for_checks,
+                boundary_buffer_m=0.5,
+                sindex=buildings_sindex,
+            )
+        inside_future = None
+        if boundary_union_4326 is not None:
+            # One STRtree traversal for "boundary contains building" (i.e.
+            # the building is within it) instead of a within() per building
+            inside_future = pool.submit(
+                buildings_4326_sindex.query, boundary_union_4326, predicate="contains"
+            )
+
+        overlaps_metric = overlaps_future.result()
+        road_conflicts_metric = (
+            road_future.result()
+            if road_future is not None
+            else gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
         )
-        per_bldg = pd.concat([a, b], ignore_index=True)
-
-        per_bldg["sev"] = per_bldg["overlap_type"].map(sev).fillna(1).astype(int)
-        per_bldg = per_bldg.groupby("bldg_id", as_index=False)["sev"].max()
-        per_bldg["error_class"] = per_bldg["sev"].map(inv)
+        boundary_overlap_metric = (
+            boundary_future.result() if boundary_future is not None else None
+        )
+        inside = inside_future.result() if inside_future is not None else None
 
-        ids = set(per_bldg["bldg_id"].astype(int))
-        overlap_buildings_metric = buildings_metric[
-            buildings_metric["bldg_id"].isin(ids)
-        ].copy()
-        overlap_buildings_metric["error_type"] = "building_overlap"
-        overlap_buildings_metric = overlap_buildings_metric.merge(
-            per_bldg[["bldg_id", "error_class"]],
-            on="bldg_id",
-            how="left",
+    overlap_buildings_metric = gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
+    if overlaps_metric is not None and not overlaps_metric.empty:
+        # Worst overlap class per building: sort the (building, severity)
+        # edges by building and reduce each run with np.maximum.reduceat
+        classes = np.array(["", "sliver", "partial", "duplicate"])
+        otype = overlaps_metric["overlap_type"].to_numpy()
+        pair_sev = np.select(
+            [otype == "duplicate", otype == "partial"], [3, 2], default=1
+        ).astype(np.int8)
+        bldg = np.concatenate(
+            [overlaps_metric["bldg_a"].to_numpy(), overlaps_metric["bldg_b"].to_numpy()]
         )
-        overlap_buildings_metric["error_class"] = overlap_buildings_metric[
-            "error_class"
-        ].fillna("sliver")
+        sev = np.concatenate([pair_sev, pair_sev])
+        order = np.argsort(bldg, kind="stable")
+        bldg, sev = bldg[order], sev[order]
+        starts = np.flatnonzero(np.r_[True, bldg[1:] != bldg[:-1]])
+        max_sev = np.maximum.reduceat(sev, starts)
+
+        # _select_buildings returns rows in bldg_id order, aligned with starts
+        overlap_buildings_metric = _select_buildings(
+            buildings_metric, bldg[starts]
+        ).reset_index(drop=True)
+        overlap_buildings_metric["error_type"] = "building_overlap"
+        overlap_buildings_metric["error_class"] = classes[max_sev]
 
-    road_conflicts_metric = gpd.GeoDataFrame(geometry=[], crs=buildings_metric.crs)
     road_conflict_buildings_metric = gpd.GeoDataFrame(
         geometry=[], crs=buildings_metric.crs
     )
-    if not roads_metric.empty:
-        road_conflicts_metric = find_buildings_on_roads(
-            buildings_metric=buildings_metric[["bldg_id", "geometry"]],
-            roads_metric=roads_metric[["osmid", "geometry"]],
-            road_buffer_m=config.road_conflict.road_buffer_m,
-            min_intersection_area_m2=config.road_conflict.min_intersection_area_m2,
-        )
-
-        if road_conflicts_metric is not None and not road_conflicts_metric.empty:
-            ids = set(road_conflicts_metric["bldg_id"])
-            road_conflict_buildings_metric = buildings_metric[
-                buildings_metric["bldg_id"].isin(ids)
-            ].copy()
-            road_conflict_buildings_metric["error_type"] = "building_on_road"
-            road_conflict_buildings_metric["error_class"] = "road_buffer"
-
-    boundary_overlap_metric = None
-    if boundary_metric_for_checks is not None:
-        boundary_overlap_metric = find_buildings_touching_boundary(
-            buildings_metric=buildings_metric[["bldg_id", "osmid", "geometry"]],
-            boundary_metric=boundary_metric_for_checks,
-            boundary_buffer_m=0.5,
+    if road_conflicts_metric is not None and not road_conflicts_metric.empty:
+        road_conflict_buildings_metric = _select_buildings(
+            buildings_metric, road_conflicts_metric["bldg_id"].values
         )
+        road_conflict_buildings_metric["error_type"] = "building_on_road"
+        road_conflict_buildings_metric["error_class"] = "road_buffer"
 
     outside_boundary_metric = gpd.GeoDataFrame(
         {
@@ -242,13 +342,12 @@ def run_pipeline(
         crs=buildings_metric.crs,
     )
 
-    if boundary_union_4326 is not None:
-        outside_boundary_metric = buildings_4326[
-            ~buildings_4326.within(boundary_union_4326)
-        ].copy()
-        outside_boundary_metric = outside_boundary_metric.to_crs(crs_pair.crs_metric)
-        outside_boundary_metric["bldg_id"] = outside_boundary_metric.index.astype(int)
-        outside_boundary_metric = _ensure_osmid(outside_boundary_metric)
+    if inside is not None:
+        outside = np.ones(len(buildings_4326), dtype=bool)
+        outside[inside] = False
+        # buildings_metric is row-aligned with buildings_4326 and already
+        # carries bldg_id/osmid, so the subset needs no second reprojection
+        outside_boundary_metric = buildings_metric.take(np.flatnonzero(outside))
         outside_boundary_metric["error_type"] = "outside_boundary"
         outside_boundary_metric["error_class"] = "outside"
 
@@ -257,9 +356,12 @@ def run_pipeline(
         geometry=[], crs=buildings_metric.crs
     )
     if boundary_overlap_metric is not None and not boundary_overlap_metric.empty:
-        boundary_overlap_buildings_metric = boundary_overlap_metric.copy()
+        # Only read by _merge_errors, so no copy unless a column is added
+        boundary_overlap_buildings_metric = boundary_overlap_metric
         if "error_class" not in boundary_overlap_buildings_metric.columns:
-            boundary_overlap_buildings_metric["error_class"] = "boundary"
+            boundary_overlap_buildings_metric = boundary_overlap_metric.assign(
+                error_class="boundary"
+            )
 
     errors_metric = _merge_errors(
         overlap_buildings_metric,
@@ -270,14 +372,15 @@ def run_pipeline(
         boundary_overlap_buildings_metric,
     )
 
-    error_ids = set(errors_metric["bldg_id"])
-    buildings_clean_metric = buildings_metric[
-        ~buildings_metric["bldg_id"].isin(error_ids)
-    ]
+    buildings_clean_metric = _select_buildings(
+        buildings_metric, errors_metric["bldg_id"].values, exclude=True
+    )
 
-    buildings_clean_4326 = buildings_clean_metric.to_crs(4326)
-    overlap_buildings_4326 = overlap_buildings_metric.to_crs(4326)
-    errors_4326 = errors_metric.to_crs(4326)
+    buildings_clean_4326 = _with_wgs84_geometry(buildings_clean_metric, buildings_4326)
+    overlap_buildings_4326 = _with_wgs84_geometry(
+        overlap_buildings_metric, buildings_4326
+    )
+    errors_4326 = _with_wgs84_geometry(errors_metric, buildings_4326)
 
     metrics = build_summary_metrics(
         buildings_4326=buildings_4326,
@@ -310,6 +413,7 @@ def run_pipeline(
         overlap_buildings_4326=overlap_buildings_4326,
         errors_4326=errors_4326,
         attribution_text=attribution_text,
+        sidecar_min_features=config.webmap.sidecar_min_features,
     )
 
     return PipelineOutputs(
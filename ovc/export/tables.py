@@ -1,38 +1,33 @@
 from __future__ import annotations
+import csv
 from pathlib import Path
-import pandas as pd
+
+
+def _metric_category(key: str) -> str:
+    if key.startswith("total_"):
+        return "summary"
+    if key.startswith("count_"):
+        return "error_counts"
+    if key.startswith("top_"):
+        return "ranking"
+    return "other"
 
 
 def write_metrics_csv(path: Path, metrics: dict) -> None:
     """
     Write metrics to a well-formatted CSV file.
 
+    Rows are streamed with the stdlib ``csv`` writer; a few dozen metrics
+    do not warrant building a DataFrame.
+
     Parameters:
         path: Output CSV path
         metrics: Dictionary of metric name -> value pairs
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to dataframe with descriptive columns
-    rows = []
-    for key, value in metrics.items():
-        # Categorize metrics
-        if key == "total_errors" or key.startswith("total_"):
-            category = "summary"
-        elif key.startswith("count_"):
-            category = "error_counts"
-        elif key.startswith("top_"):
-            category = "ranking"
-        else:
-            category = "other"
-
-        rows.append(
-            {
-                "category": category,
-                "metric": key,
-                "value": value,
-            }
-        )
-
-    df = pd.DataFrame(rows)
-    df.to_csv(path, index=False)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["category", "metric", "value"])
+        for key, value in metrics.items():
+            writer.writerow([_metric_category(key), key, value])
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 import folium
 import geopandas as gpd
+import numpy as np
+import shapely
+
+from ovc.core.crs import _epsg, to_crs
+from ovc.core.logging import get_logger
 
 # Colors (from main branch styling)
 OVERLAP_COLOR = "#ff0000"  # Red
@@ -12,31 +18,123 @@ CLEAN_BUILDINGS_COLOR = "#90ee90"  # Light green
 BOUNDARY_COLOR = "#1e1e1e"
 ROADS_COLOR = "#8b4513"
 
+# Above this many embedded features the single-file map gets slow to open
+LARGE_MAP_FEATURES = 100_000
+
+
+def _to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    # Layers handed to the map are normally WGS 84 already; only reproject
+    # (through the cached transformer in ovc.core.crs) when they are not.
+    if gdf.crs is None or gdf.crs.equals(_epsg(4326)):
+        return gdf
+    return to_crs(gdf, _epsg(4326))
+
+
+def _round_coordinates(gdf: gpd.GeoDataFrame, decimals: int = 6) -> gpd.GeoDataFrame:
+    # Display only: 6 decimal degrees is ~11 cm, and the shorter numbers cut
+    # the GeoJSON written into the page considerably. Plain rounding rather
+    # than shapely.set_precision, which snaps and may rebuild the geometry.
+    geoms = np.asarray(gdf.geometry.values)
+    include_z = bool(shapely.has_z(geoms).any())
+    coords = shapely.get_coordinates(geoms, include_z=include_z)
+    rounded = shapely.set_coordinates(geoms.copy(), np.round(coords, decimals))
+    return gdf.set_geometry(rounded, crs=gdf.crs)
+
+
+def _feature_collection(gdf: gpd.GeoDataFrame) -> dict:
+    """GeoJSON FeatureCollection dict of a WGS 84 frame, built column-wise.
+
+    Handing folium a GeoDataFrame makes it serialise ``__geo_interface__``
+    (one dict per row via ``iterfeatures``) and parse that back. Here the
+    geometries are written by ``shapely.to_geojson`` and the attributes by
+    ``DataFrame.to_json``, and each is parsed once. Like GeoPandas, the
+    string index becomes the feature ``id`` and missing values become null;
+    unlike it, no per-feature ``bbox`` is written.
+    """
+    geoms = shapely.to_geojson(np.asarray(gdf.geometry.values))
+    geoms[shapely.is_missing(gdf.geometry.values)] = "null"
+    geometries = json.loads("[" + ",".join(geoms.tolist()) + "]")
+    attrs = gdf.drop(columns=gdf.geometry.name)
+    if len(attrs.columns):
+        properties = json.loads(attrs.to_json(orient="records", date_format="iso"))
+    else:
+        properties = [{}] * len(gdf)
+    ids = gdf.index.astype(str).tolist()
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"id": i, "type": "Feature", "properties": p, "geometry": g}
+            for i, p, g in zip(ids, properties, geometries)
+        ],
+    }
+
+
+def _geojson_layer(
+    gdf: gpd.GeoDataFrame,
+    html_path: Path,
+    slug: str,
+    sidecar_min_features: int | None,
+    **kwargs,
+) -> folium.GeoJson:
+    """Build a GeoJson layer, inlined or written next to the HTML.
+
+    Layers with at least ``sidecar_min_features`` features are written to
+    ``<html stem>_<slug>.geojson`` beside the map and loaded by the page at
+    view time instead of being embedded in the HTML.
+    """
+    gdf = _round_coordinates(_to_wgs84(gdf))
+    if sidecar_min_features is None or len(gdf) < sidecar_min_features:
+        return folium.GeoJson(_feature_collection(gdf), **kwargs)
+    sidecar = html_path.parent / f"{html_path.stem}_{slug}.geojson"
+    # folium needs a per-feature id to style linked data; the index is
+    # written as the GeoJSON id
+    sidecar.write_text(json.dumps(_feature_collection(gdf)), encoding="utf-8")
+    layer = folium.GeoJson(str(sidecar), embed=False, **kwargs)
+    # folium links the path it was given; the page needs it relative to itself
+    layer.embed_link = sidecar.name
+    return layer
+
+
+# Every feature of a layer shares one style, so the dicts are built once and
+# the style callbacks folium runs per feature just return them.
+_STYLE_BOUNDARY = {"color": BOUNDARY_COLOR, "weight": 2.5, "fillOpacity": 0.02}
+_STYLE_ROADS = {"color": ROADS_COLOR, "weight": 1.4, "fillOpacity": 0.0}
+_STYLE_BUILDINGS_CLEAN = {
+    "color": CLEAN_BUILDINGS_COLOR,
+    "weight": 1,
+    "fillOpacity": 0.4,
+}
+_STYLE_OVERLAP_ERRORS = {"color": OVERLAP_COLOR, "weight": 2, "fillOpacity": 0.6}
+_STYLE_ROAD_CONFLICT = {"color": ROAD_CONFLICT_COLOR, "weight": 2, "fillOpacity": 0.6}
+_STYLE_OUTSIDE_BOUNDARY = {
+    "color": OUTSIDE_BOUNDARY_COLOR,
+    "weight": 2,
+    "fillOpacity": 0.6,
+}
+
 
 def _style_boundary(_):
-    return {"color": BOUNDARY_COLOR, "weight": 2.5, "fillOpacity": 0.02}
+    return _STYLE_BOUNDARY
 
 
 def _style_roads(_):
-    return {"color": ROADS_COLOR, "weight": 1.4, "fillOpacity": 0.0}
+    return _STYLE_ROADS
 
 
 def _style_buildings_clean(_):
-    return {"color": CLEAN_BUILDINGS_COLOR, "weight": 1, "fillOpacity": 0.4}
+    return _STYLE_BUILDINGS_CLEAN
 
 
 def _style_overlap_errors(_):
-    return {"color": OVERLAP_COLOR, "weight": 2, "fillOpacity": 0.6}
+    return _STYLE_OVERLAP_ERRORS
 
 
-def _style_error_buildings(feature):
-    et = (feature.get("properties") or {}).get("error_type", "")
-    color = OVERLAP_COLOR
-    if et == "building_on_road":
-        color = ROAD_CONFLICT_COLOR
-    elif et == "outside_boundary":
-        color = OUTSIDE_BOUNDARY_COLOR
-    return {"color": color, "weight": 2, "fillOpacity": 0.6}
+def _style_road_conflict(_):
+    return _STYLE_ROAD_CONFLICT
+
+
+def _style_outside_boundary(_):
+    return _STYLE_OUTSIDE_BOUNDARY
 
 
 def _add_layer_control(m: folium.Map):
@@ -67,50 +165,93 @@ def write_webmap(
     overlap_buildings_4326: gpd.GeoDataFrame,
     errors_4326: gpd.GeoDataFrame,
     attribution_text: str,
+    sidecar_min_features: int | None = None,
 ):
+    """Write the building QC web map.
+
+    By default every layer is embedded so the HTML is self-contained. When
+    ``sidecar_min_features`` is set, layers at least that large (except the
+    boundary) are written as GeoJSON files next to the HTML and fetched by
+    the page; such maps must be served over HTTP, since browsers block
+    loading local files from a ``file://`` page.
+    """
     html_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Determine center
+    n_context = sum(
+        len(g)
+        for g in (roads_4326, buildings_clean_4326)
+        if g is not None
+        and (sidecar_min_features is None or len(g) < sidecar_min_features)
+    )
+    if n_context > LARGE_MAP_FEATURES:
+        get_logger("ovc.export.webmap").warning(
+            f"Embedding {n_context:,} road/building features in the web map — "
+            "it may be slow to open; set webmap.sidecar_min_features to write "
+            "large layers as separate GeoJSON files"
+        )
+
+    # Determine center from the layer extent; it only seeds the initial view,
+    # so the bounding box midpoint will do and no union is needed
     if boundary_4326 is not None and not boundary_4326.empty:
-        b = boundary_4326.to_crs(4326)
-        c = b.union_all().centroid
+        minx, miny, maxx, maxy = _to_wgs84(boundary_4326).total_bounds
+        location = [float(miny + maxy) / 2, float(minx + maxx) / 2]
     elif buildings_clean_4326 is not None and not buildings_clean_4326.empty:
-        c = buildings_clean_4326.to_crs(4326).union_all().centroid
+        minx, miny, maxx, maxy = _to_wgs84(buildings_clean_4326).total_bounds
+        location = [float(miny + maxy) / 2, float(minx + maxx) / 2]
     else:
-        c = type("obj", (object,), {"x": 31.0, "y": 30.0})()
+        location = [30.0, 31.0]
 
     m = folium.Map(
-        location=[float(c.y), float(c.x)],
+        location=location,
         zoom_start=12,
         tiles="cartodbpositron",
         attr=attribution_text,
         prefer_canvas=True,
     )
 
+    # Context layers (boundary, roads, clean buildings) have no tooltips, so
+    # only their geometry is serialised; the source attributes would
+    # otherwise be written into the page for every feature. They are also
+    # non-interactive, which spares the canvas renderer (preferCanvas covers
+    # GeoJSON paths too) a hit test against every feature on mouse moves.
     if boundary_4326 is not None and not boundary_4326.empty:
         folium.GeoJson(
-            boundary_4326.to_crs(4326),
+            _feature_collection(
+                _round_coordinates(_to_wgs84(boundary_4326[["geometry"]]))
+            ),
             name="Boundary",
             style_function=_style_boundary,
+            interactive=False,
         ).add_to(m)
 
     if roads_4326 is not None and not roads_4326.empty:
-        folium.GeoJson(
-            roads_4326.to_crs(4326),
+        _geojson_layer(
+            roads_4326[["geometry"]],
+            html_path,
+            "roads",
+            sidecar_min_features,
             name="Roads",
             style_function=_style_roads,
+            interactive=False,
         ).add_to(m)
 
     if buildings_clean_4326 is not None and not buildings_clean_4326.empty:
-        folium.GeoJson(
-            buildings_clean_4326.to_crs(4326),
+        _geojson_layer(
+            buildings_clean_4326[["geometry"]],
+            html_path,
+            "buildings_clean",
+            sidecar_min_features,
             name="Buildings clean",
             style_function=_style_buildings_clean,
+            interactive=False,
         ).add_to(m)
 
     if overlap_buildings_4326 is not None and not overlap_buildings_4326.empty:
-        folium.GeoJson(
-            overlap_buildings_4326.to_crs(4326),
+        _geojson_layer(
+            overlap_buildings_4326,
+            html_path,
+            "overlap_errors",
+            sidecar_min_features,
             name="Overlap errors",
             style_function=_style_overlap_errors,
             tooltip=folium.GeoJsonTooltip(
@@ -121,14 +262,17 @@ def write_webmap(
         ).add_to(m)
 
     if errors_4326 is not None and not errors_4326.empty:
-        buildings_on_road = errors_4326[
-            errors_4326["error_type"] == "building_on_road"
-        ].copy()
-        if not buildings_on_road.empty:
-            folium.GeoJson(
-                buildings_on_road.to_crs(4326),
+        # One pass over error_type instead of a masked copy per layer
+        groups = dict(list(errors_4326.groupby("error_type", sort=False)))
+        buildings_on_road = groups.get("building_on_road")
+        if buildings_on_road is not None:
+            _geojson_layer(
+                buildings_on_road,
+                html_path,
+                "buildings_on_road",
+                sidecar_min_features,
                 name="Buildings on road",
-                style_function=_style_error_buildings,
+                style_function=_style_road_conflict,
                 tooltip=folium.GeoJsonTooltip(
                     fields=["osmid", "bldg_id", "error_type", "error_class"],
                     aliases=["osmid:", "bldg_id:", "error_type:", "error_class:"],
@@ -136,14 +280,15 @@ def write_webmap(
                 ),
             ).add_to(m)
 
-        outside_boundary = errors_4326[
-            errors_4326["error_type"] == "outside_boundary"
-        ].copy()
-        if not outside_boundary.empty:
-            folium.GeoJson(
-                outside_boundary.to_crs(4326),
+        outside_boundary = groups.get("outside_boundary")
+        if outside_boundary is not None:
+            _geojson_layer(
+                outside_boundary,
+                html_path,
+                "outside_boundary",
+                sidecar_min_features,
                 name="Outside boundary",
-                style_function=_style_error_buildings,
+                style_function=_style_outside_boundary,
                 tooltip=folium.GeoJsonTooltip(
                     fields=["osmid", "bldg_id", "error_type", "error_class"],
                     aliases=["osmid:", "bldg_id:", "error_type:", "error_class:"],
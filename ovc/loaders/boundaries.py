@@ -4,6 +4,7 @@ from pathlib import Path
 import geopandas as gpd
 from ovc.core.crs import ensure_wgs84
 from ovc.core.geometry import drop_empty_and_fix
+from ovc.loaders.io import _READ_KWARGS
 
 
 @dataclass(frozen=True)
@@ -13,11 +14,11 @@ class BoundaryResult:
 
 
 def load_boundary_shapefile(path: Path) -> BoundaryResult:
-    gdf = gpd.read_file(path)
+    # Only the geometry is kept, so attribute columns are not read at all
+    gdf = gpd.read_file(path, columns=[], **_READ_KWARGS)
     gdf = ensure_wgs84(gdf)
     gdf = drop_empty_and_fix(gdf)
     if gdf.empty:
         raise ValueError(f"Boundary is empty: {path}")
-    gdf = gdf[["geometry"]].copy()
     gdf["aoi_name"] = path.stem
     return BoundaryResult(name=path.stem, gdf_4326=gdf)
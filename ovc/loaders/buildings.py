@@ -11,8 +11,10 @@ from pathlib import Path
 import geopandas as gpd
 
 from ovc.core.crs import ensure_wgs84
-from ovc.core.geometry import drop_empty_and_fix
+from ovc.core.ids import as_str_ids
+from ovc.core.geometry import drop_empty_and_fix, renumber_rows
 from ovc.core.logging import get_logger
+from ovc.loaders.io import read_vector_file
 
 
 def load_buildings(path: Path) -> gpd.GeoDataFrame:
@@ -43,7 +45,7 @@ def load_buildings(path: Path) -> gpd.GeoDataFrame:
         )
 
     logger.info(f"Loading buildings from {path}")
-    gdf = gpd.read_file(path)
+    gdf = read_vector_file(path, ("Polygon", "MultiPolygon"))
 
     if gdf.empty:
         logger.warning("Buildings file is empty")
@@ -51,20 +53,19 @@ def load_buildings(path: Path) -> gpd.GeoDataFrame:
 
     gdf = ensure_wgs84(gdf)
 
-    # Keep only polygon geometries
-    gdf = gdf[gdf.geometry.type.isin(["Polygon", "MultiPolygon"])].copy()
-    gdf = drop_empty_and_fix(gdf)
+    # Keep only valid, non-empty polygon geometries
+    gdf = drop_empty_and_fix(gdf, ("Polygon", "MultiPolygon"))
 
     if gdf.empty:
         logger.warning("No polygon geometries found in buildings file")
         return gpd.GeoDataFrame(geometry=[], crs=4326)
 
     # Ensure an ID column exists for downstream compatibility
-    gdf = gdf.reset_index(drop=True)
+    gdf = renumber_rows(gdf)
     if "osmid" not in gdf.columns:
-        gdf["osmid"] = gdf.index.astype(str)
+        gdf["osmid"] = as_str_ids(gdf.index)
     else:
-        gdf["osmid"] = gdf["osmid"].astype(str)
+        gdf["osmid"] = as_str_ids(gdf["osmid"])
 
     if len(gdf) > 100_000:
         logger.warning(
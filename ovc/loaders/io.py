@@ -0,0 +1,80 @@
+"""Shared vector file reading for the loaders."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import geopandas as gpd
+
+from ovc.core.logging import get_logger
+
+try:
+    import pyogrio
+except ImportError:  # pragma: no cover - fiona-only installs
+    pyogrio = None
+
+# Reads go through pyogrio (and Arrow when pyarrow is present) rather than
+# Fiona's per-feature dicts; GeoPandas < 1.0 still defaults to Fiona.
+_READ_KWARGS: dict = {}
+if pyogrio is not None:
+    _READ_KWARGS["engine"] = "pyogrio"
+    try:
+        import pyarrow  # noqa: F401
+
+        _READ_KWARGS["use_arrow"] = True
+    except ImportError:
+        pass
+
+
+def read_vector_file(
+    path: Path,
+    geom_types: tuple[str, ...],
+    bbox: gpd.GeoDataFrame | None = None,
+) -> gpd.GeoDataFrame:
+    """Read a vector file, letting OGR drop unwanted features where it can.
+
+    With pyogrio, features whose geometry type is not in ``geom_types`` are
+    filtered by OGR (``OGR_GEOMETRY`` attribute filter) and ``bbox``, if
+    given, limits the read to features overlapping its extent. Drivers that
+    reject a filter (e.g. GeoPackage, whose filters are SQLite SQL) are read
+    without it, so callers must still filter the result themselves.
+
+    Parameters
+    ----------
+    path : Path
+        Vector file to read.
+    geom_types : tuple of str
+        Geometry types to keep, e.g. ``("Polygon", "MultiPolygon")``.
+    bbox : GeoDataFrame, optional
+        Only read features intersecting the extent of this frame
+        (reprojected to the file CRS by GeoPandas).
+
+    Returns
+    -------
+    GeoDataFrame
+        The features read.
+    """
+    logger = get_logger("ovc.loaders.io")
+    attempts = []
+    if pyogrio is not None:
+        where = None
+        try:
+            declared = pyogrio.read_info(path).get("geometry_type")
+        except Exception:
+            declared = None
+        # a layer declared as one of the wanted types needs no filter
+        if declared not in geom_types:
+            names = ", ".join(f"'{t.upper()}'" for t in geom_types)
+            where = f"OGR_GEOMETRY IN ({names})"
+        if where is not None:
+            attempts.append({"where": where})
+    if bbox is not None:
+        attempts.append({"bbox": bbox})
+    for kwargs in attempts:
+        if bbox is not None:
+            kwargs.setdefault("bbox", bbox)
+        try:
+            return gpd.read_file(path, **_READ_KWARGS, **kwargs)
+        except Exception as e:
+            logger.debug(f"filtered read {sorted(kwargs)} failed ({e})")
+    return gpd.read_file(path, **_READ_KWARGS)
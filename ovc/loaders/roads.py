@@ -11,8 +11,10 @@ from pathlib import Path
 import geopandas as gpd
 
 from ovc.core.crs import ensure_wgs84
-from ovc.core.geometry import drop_empty_and_fix, clip_to_boundary
+from ovc.core.ids import as_str_ids
+from ovc.core.geometry import drop_empty_and_fix, clip_to_boundary, renumber_rows
 from ovc.core.logging import get_logger
+from ovc.loaders.io import read_vector_file
 
 
 def load_roads(
@@ -48,7 +50,12 @@ def load_roads(
         )
 
     logger.info(f"Loading roads from {path}")
-    gdf = gpd.read_file(path)
+    # Roads are clipped to the boundary below, so let OGR skip features
+    # outside its extent at read time (bbox is reprojected to the file CRS)
+    bbox = (
+        boundary_4326 if boundary_4326 is not None and not boundary_4326.empty else None
+    )
+    gdf = read_vector_file(path, ("LineString", "MultiLineString"), bbox=bbox)
 
     if gdf.empty:
         logger.warning("Roads file is empty")
@@ -56,9 +63,8 @@ def load_roads(
 
     gdf = ensure_wgs84(gdf)
 
-    # Keep only line geometries
-    gdf = gdf[gdf.geometry.type.isin(["LineString", "MultiLineString"])].copy()
-    gdf = drop_empty_and_fix(gdf)
+    # Keep only valid, non-empty line geometries
+    gdf = drop_empty_and_fix(gdf, ("LineString", "MultiLineString"))
 
     if gdf.empty:
         logger.warning("No line geometries found in roads file")
@@ -72,13 +78,13 @@ def load_roads(
             logger.warning("No roads within boundary after clipping")
             return gpd.GeoDataFrame(geometry=[], crs=4326)
 
-    gdf = gdf.reset_index(drop=True)
+    gdf = renumber_rows(gdf)
 
     # Ensure an ID column exists for downstream compatibility
     if "osmid" not in gdf.columns:
-        gdf["osmid"] = gdf.index.astype(str)
+        gdf["osmid"] = as_str_ids(gdf.index)
     else:
-        gdf["osmid"] = gdf["osmid"].astype(str)
+        gdf["osmid"] = as_str_ids(gdf["osmid"])
 
     if len(gdf) > 100_000:
         logger.warning(
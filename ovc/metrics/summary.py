@@ -1,6 +1,16 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+# category order of the overlap type counts below
+_OVERLAP_TYPES = ["duplicate", "partial", "sliver"]
+
+
+def _non_empty(df: gpd.GeoDataFrame | None) -> gpd.GeoDataFrame | None:
+    """``df``, or None when it is missing or has no rows."""
+    return df if df is not None and not df.empty else None
 
 
 def build_summary_metrics(
@@ -12,74 +22,47 @@ def build_summary_metrics(
 ) -> dict:
     total_buildings = 0 if buildings_4326 is None else int(len(buildings_4326))
 
-    overlap_count = 0 if overlaps_metric is None else int(len(overlaps_metric))
-    overlap_total_area = (
-        0.0
-        if overlaps_metric is None or overlaps_metric.empty
-        else float(overlaps_metric["inter_area_m2"].sum())
-    )
-    overlap_avg_area = (
-        0.0
-        if overlaps_metric is None or overlaps_metric.empty
-        else float(overlaps_metric["inter_area_m2"].mean())
-    )
+    overlaps = _non_empty(overlaps_metric)
+    road_conflicts = _non_empty(road_conflicts_buildings_metric)
+    boundary_overlaps = _non_empty(boundary_overlap_buildings_metric)
+    outside_boundary = _non_empty(outside_boundary_buildings_metric)
 
+    overlap_count = 0
+    overlap_total_area = 0.0
+    overlap_avg_area = 0.0
     dup = 0
     part = 0
     sliv = 0
-    if overlaps_metric is not None and not overlaps_metric.empty:
-        vc = overlaps_metric["overlap_type"].value_counts()
-        dup = int(vc.get("duplicate", 0))
-        part = int(vc.get("partial", 0))
-        sliv = int(vc.get("sliver", 0))
+    if overlaps is not None:
+        overlap_count = int(len(overlaps))
+        area = overlaps["inter_area_m2"].agg(["sum", "mean"])
+        overlap_total_area = float(area["sum"])
+        overlap_avg_area = float(area["mean"])
+        codes = pd.Categorical(
+            overlaps["overlap_type"], categories=_OVERLAP_TYPES
+        ).codes
+        dup, part, sliv = np.bincount(codes[codes >= 0], minlength=3).tolist()
 
-    count_building_on_road = (
-        0
-        if road_conflicts_buildings_metric is None
-        else int(len(road_conflicts_buildings_metric))
-    )
+    count_building_on_road = 0 if road_conflicts is None else int(len(road_conflicts))
     count_building_overlap = overlap_count
     count_building_boundary_overlap = (
-        0
-        if boundary_overlap_buildings_metric is None
-        else int(len(boundary_overlap_buildings_metric))
+        0 if boundary_overlaps is None else int(len(boundary_overlaps))
     )
     count_outside_boundary = (
-        0
-        if outside_boundary_buildings_metric is None
-        else int(len(outside_boundary_buildings_metric))
+        0 if outside_boundary is None else int(len(outside_boundary))
     )
 
-    error_buildings_ids = set()
-    if (
-        road_conflicts_buildings_metric is not None
-        and not road_conflicts_buildings_metric.empty
-        and "bldg_id" in road_conflicts_buildings_metric.columns
-    ):
-        error_buildings_ids |= set(
-            road_conflicts_buildings_metric["bldg_id"].astype(int).tolist()
-        )
-    if (
-        boundary_overlap_buildings_metric is not None
-        and not boundary_overlap_buildings_metric.empty
-        and "bldg_id" in boundary_overlap_buildings_metric.columns
-    ):
-        error_buildings_ids |= set(
-            boundary_overlap_buildings_metric["bldg_id"].astype(int).tolist()
-        )
-    if (
-        outside_boundary_buildings_metric is not None
-        and not outside_boundary_buildings_metric.empty
-        and "bldg_id" in outside_boundary_buildings_metric.columns
-    ):
-        error_buildings_ids |= set(
-            outside_boundary_buildings_metric["bldg_id"].astype(int).tolist()
-        )
-    if overlaps_metric is not None and not overlaps_metric.empty:
-        error_buildings_ids |= set(overlaps_metric["bldg_a"].astype(int).tolist())
-        error_buildings_ids |= set(overlaps_metric["bldg_b"].astype(int).tolist())
+    id_arrays = []
+    for df in (road_conflicts, boundary_overlaps, outside_boundary):
+        if df is not None and "bldg_id" in df.columns:
+            id_arrays.append(df["bldg_id"].to_numpy(dtype=np.int64))
+    if overlaps is not None:
+        id_arrays.append(overlaps["bldg_a"].to_numpy(dtype=np.int64))
+        id_arrays.append(overlaps["bldg_b"].to_numpy(dtype=np.int64))
 
-    error_buildings_count = int(len(error_buildings_ids))
+    error_buildings_count = (
+        int(np.unique(np.concatenate(id_arrays)).size) if id_arrays else 0
+    )
     error_buildings_ratio = (
         float(error_buildings_count / total_buildings) if total_buildings > 0 else 0.0
     )
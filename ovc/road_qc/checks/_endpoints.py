@@ -0,0 +1,114 @@
+"""Road endpoint table shared by the endpoint-based checks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from ovc.core.spatial_index import query_dwithin
+
+# shapely type ids of LineString, LinearRing and MultiLineString
+_LINE_TYPE_IDS = (1, 2, 5)
+
+
+@dataclass(frozen=True)
+class EndpointIndex:
+    """Start and end points of every road line part, extracted once.
+
+    ``xy`` holds the start and end of each part interleaved, in row/part
+    order, and ``owner`` is the row position of the road each endpoint
+    belongs to. Road ids are factorized once: ``row_code`` holds an int64
+    code per road row and ``id_values`` the id behind each code, so checks
+    compare and group integers and only map back to ids for output.
+    """
+
+    xy: np.ndarray
+    owner: np.ndarray
+    row_code: np.ndarray
+    id_values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    @cached_property
+    def road_code(self) -> np.ndarray:
+        """Road id code of each endpoint."""
+        return self.row_code[self.owner]
+
+    @cached_property
+    def road_id(self) -> np.ndarray:
+        """Road id of each endpoint."""
+        return self.id_values[self.road_code]
+
+    @cached_property
+    def points(self) -> np.ndarray:
+        """Endpoints as shapely Points."""
+        return shapely.points(self.xy)
+
+    @cached_property
+    def tree(self) -> shapely.STRtree:
+        """STRtree over :attr:`points`, built on first use."""
+        return shapely.STRtree(self.points)
+
+    def pairs_within(self, distance: float) -> tuple[np.ndarray, np.ndarray]:
+        """Positions of all endpoint pairs at most ``distance`` apart.
+
+        Includes each endpoint paired with itself.
+        """
+        return query_dwithin(self.tree, self.points, distance)
+
+
+def _endpoint_coords(geoms) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end coordinates of every line part, in row/part order.
+
+    Returns an ``(n, 2)`` (or ``(n, 3)`` for 3D data) coordinate array with
+    the start and end of each part interleaved, and the position of the
+    owning row for each endpoint. Parts with fewer than two vertices and
+    non-line geometries contribute nothing.
+    """
+    geoms = np.asarray(geoms)
+    lines = np.flatnonzero(np.isin(shapely.get_type_id(geoms), _LINE_TYPE_IDS))
+    parts, part_row = shapely.get_parts(geoms[lines], return_index=True)
+    include_z = bool(shapely.has_z(parts).any())
+    coords, coord_part = shapely.get_coordinates(
+        parts, include_z=include_z, return_index=True
+    )
+    n_coords = np.bincount(coord_part, minlength=len(parts))
+    last = np.cumsum(n_coords) - 1
+    first = last - n_coords + 1
+    ok = n_coords >= 2
+    xy = np.empty((2 * int(ok.sum()), coords.shape[1]))
+    xy[0::2] = coords[first[ok]]
+    xy[1::2] = coords[last[ok]]
+    return xy, np.repeat(lines[part_row[ok]], 2)
+
+
+def _road_ids(roads: gpd.GeoDataFrame) -> np.ndarray:
+    """The ``road_id`` column, or the string index when it is missing."""
+    if "road_id" in roads.columns:
+        return roads["road_id"].values
+    return roads.index.astype(str).values
+
+
+def build_endpoint_index(roads_metric: gpd.GeoDataFrame) -> EndpointIndex:
+    """Extract the endpoint table of ``roads_metric`` in one vectorized pass.
+
+    Build it once and pass it to both ``find_dangles`` and
+    ``find_disconnected_segments`` to avoid extracting endpoints twice.
+
+    Parameters:
+        roads_metric: Road geometries in metric CRS
+
+    Returns:
+        EndpointIndex over the roads' line parts
+    """
+    xy, owner = _endpoint_coords(roads_metric.geometry.values)
+    row_code, id_values = pd.factorize(_road_ids(roads_metric), use_na_sentinel=False)
+    return EndpointIndex(
+        xy=xy, owner=owner, row_code=row_code.astype(np.int64), id_values=id_values
+    )
@@ -1,36 +1,54 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point, LineString, MultiLineString
-from collections import Counter
+import shapely
 
+from ovc.core.geometry import union_boundary
+from ovc.road_qc.checks._endpoints import EndpointIndex, build_endpoint_index
 from ovc.road_qc.config import RoadQCConfig
 
 
-def _extract_endpoints(geom) -> list[Point]:
-    """Extract start and end points from LineString or MultiLineString."""
-    endpoints = []
+def _cell_counts(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """Number of endpoints sharing each endpoint's tolerance grid cell.
+
+    Coordinates are snapped to ``round(c / tolerance)`` (round half to
+    even, as Python's ``round``) and the integer cell pairs are packed into
+    one int64 key, so the grouping is a single ``np.unique``.
+    """
+    q = np.round(xy / tolerance).astype(np.int64)
+    q -= q.min(axis=0)
+    span_y = int(q[:, 1].max()) + 1
+    if int(q[:, 0].max()) < np.iinfo(np.int64).max // span_y:
+        keys = q[:, 0] * span_y + q[:, 1]
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    else:
+        _, inverse, counts = np.unique(
+            q, axis=0, return_inverse=True, return_counts=True
+        )
+    return counts[inverse.reshape(-1)]
+
 
-    if isinstance(geom, LineString):
-        coords = list(geom.coords)
-        if len(coords) >= 2:
-            endpoints.append(Point(coords[0]))
-            endpoints.append(Point(coords[-1]))
-    elif isinstance(geom, MultiLineString):
-        for line in geom.geoms:
-            coords = list(line.coords)
-            if len(coords) >= 2:
-                endpoints.append(Point(coords[0]))
-                endpoints.append(Point(coords[-1]))
+@lru_cache(maxsize=8)
+def _boundary_buffer(boundary_wkb: bytes, distance: float):
+    """Prepared buffer of a boundary's outline, cached per boundary/distance.
 
-    return endpoints
+    Keyed on the WKB of the boundary union so repeated calls with the same
+    boundary (e.g. per tile) skip the buffer and the GEOS prepare step.
+    """
+    boundary_buffer = shapely.from_wkb(boundary_wkb).boundary.buffer(distance)
+    shapely.prepare(boundary_buffer)
+    return boundary_buffer
 
 
 def find_dangles(
     roads_metric: gpd.GeoDataFrame,
     config: RoadQCConfig,
     boundary_metric: gpd.GeoDataFrame | None = None,
+    endpoints: EndpointIndex | None = None,
 ) -> gpd.GeoDataFrame:
     """
     Detect dangling endpoints (dead ends) in the road network.
@@ -45,6 +63,8 @@ def find_dangles(
         roads_metric: Road geometries in metric CRS
         config: Road QC configuration
         boundary_metric: Optional boundary to filter out edge endpoints
+        endpoints: Endpoint table of ``roads_metric`` if already built
+            (see ``build_endpoint_index``)
 
     Returns:
         GeoDataFrame with dangle points, includes error_type column
@@ -56,10 +76,6 @@ def find_dangles(
             crs=getattr(roads_metric, "crs", None),
         )
 
-    roads = roads_metric.copy()
-    if "road_id" not in roads.columns:
-        roads["road_id"] = roads.index.astype(str)
-
     tolerance = config.dangle_tolerance_m
     if tolerance <= 0:
         tolerance = 1.0  # Guard against zero division
@@ -68,66 +84,43 @@ def find_dangles(
     boundary_buffer = None
     if boundary_metric is not None and not boundary_metric.empty:
         # Buffer the boundary line by tolerance
-        boundary_union = boundary_metric.union_all()
-        boundary_buffer = boundary_union.boundary.buffer(tolerance * 3)
-
-    # Extract all endpoints with their coordinates (rounded for matching)
-    endpoints = []
-    for _, row in roads.iterrows():
-        geom = row.geometry
-        if geom is None or geom.is_empty:
-            continue
-
-        pts = _extract_endpoints(geom)
-        for pt in pts:
-            # Skip endpoints near the boundary (they likely connect to external roads)
-            if boundary_buffer is not None and boundary_buffer.contains(pt):
-                continue
-
-            # Round to tolerance for grouping
-            key = (
-                round(pt.x / tolerance) * tolerance,
-                round(pt.y / tolerance) * tolerance,
-            )
-            endpoints.append(
-                {
-                    "road_id": row["road_id"],
-                    "point": pt,
-                    "key": key,
-                }
-            )
-
-    if not endpoints:
+        boundary_union = union_boundary(boundary_metric)
+        boundary_buffer = _boundary_buffer(
+            shapely.to_wkb(boundary_union), float(tolerance * 3)
+        )
+
+    if endpoints is None:
+        endpoints = build_endpoint_index(roads_metric)
+    xy, road_ids = endpoints.xy, endpoints.road_id
+
+    if boundary_buffer is not None and len(xy):
+        # Skip endpoints near the boundary (they likely connect to external roads)
+        near = shapely.contains(boundary_buffer, endpoints.points)
+        xy, road_ids = xy[~near], road_ids[~near]
+
+    if len(xy) == 0:
         return gpd.GeoDataFrame(
             {"road_id": [], "error_type": [], "geometry": []},
             geometry="geometry",
-            crs=roads.crs,
+            crs=roads_metric.crs,
         )
 
-    # Count occurrences of each endpoint location
-    key_counts = Counter(ep["key"] for ep in endpoints)
-
-    # Endpoints that appear only once are dangles
-    dangles = []
-    seen_keys = set()
-
-    for ep in endpoints:
-        key = ep["key"]
-        if key_counts[key] == 1 and key not in seen_keys:
-            dangles.append(
-                {
-                    "road_id": ep["road_id"],
-                    "error_type": "dangle",
-                    "geometry": ep["point"],
-                }
-            )
-            seen_keys.add(key)
-
-    if not dangles:
+    # Endpoints whose tolerance cell holds no other endpoint are dangles
+    dangle = _cell_counts(xy[:, :2], tolerance) == 1
+
+    if not dangle.any():
         return gpd.GeoDataFrame(
             {"road_id": [], "error_type": [], "geometry": []},
             geometry="geometry",
-            crs=roads.crs,
+            crs=roads_metric.crs,
         )
 
-    return gpd.GeoDataFrame(dangles, geometry="geometry", crs=roads.crs)
+    return gpd.GeoDataFrame(
+        {
+            "road_id": road_ids[dangle],
+            "error_type": "dangle",
+            "geometry": shapely.points(xy[dangle]),
+        },
+        geometry="geometry",
+        crs=roads_metric.crs,
+    )
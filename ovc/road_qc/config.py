@@ -18,3 +18,7 @@ class RoadQCConfig:
 
     # Disconnected: max distance to nearest road endpoint (meters)
     disconnect_tolerance_m: float = 2.0
+
+    # Web map: road and error layers with at least this many features are
+    # written as GeoJSON next to the HTML; None keeps the map self-contained
+    webmap_sidecar_min_features: int | None = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 
@@ -24,17 +25,14 @@ def compute_road_qc_metrics(errors: gpd.GeoDataFrame) -> dict:
             "top_3_errors": [],
         }
 
-    error_counts = errors["error_type"].value_counts().to_dict()
-    total_errors = int(sum(error_counts.values()))
-
-    # Sort by count descending, take top 3
-    sorted_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-    top_3 = sorted_errors[:3]
+    # value_counts is already sorted by count, descending
+    vc = errors["error_type"].value_counts()
+    counts = vc.values.tolist()
 
     return {
-        "total_errors": total_errors,
-        "error_counts": {k: int(v) for k, v in error_counts.items()},
-        "top_3_errors": [(str(k), int(v)) for k, v in top_3],
+        "total_errors": int(sum(counts)),
+        "error_counts": dict(zip(vc.index, counts)),
+        "top_3_errors": list(zip(vc.index[:3].astype(str), counts[:3])),
     }
 
 
@@ -47,6 +45,9 @@ def merge_errors(*error_gdfs: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
 
     Returns:
         Combined GeoDataFrame with all errors
+
+    Raises:
+        ValueError: If the non-empty inputs are not all in the same CRS
     """
     valid_gdfs = [g for g in error_gdfs if g is not None and not g.empty]
 
@@ -58,6 +59,22 @@ def merge_errors(*error_gdfs: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         )
 
     crs = valid_gdfs[0].crs
-    combined = pd.concat(valid_gdfs, ignore_index=True)
+    # Inputs are merged as they are, never reprojected; callers convert the
+    # check outputs to one CRS first (the pipeline uses WGS 84)
+    if any(g.crs != crs for g in valid_gdfs[1:]):
+        raise ValueError("All error GeoDataFrames must share the same CRS")
+    columns = list(valid_gdfs[0].columns)
+    if "geometry" not in columns or any(
+        set(g.columns) != set(columns) for g in valid_gdfs[1:]
+    ):
+        combined = pd.concat(valid_gdfs, ignore_index=True)
+        return gpd.GeoDataFrame(combined, geometry="geometry", crs=crs)
 
-    return gpd.GeoDataFrame(combined, geometry="geometry", crs=crs)
+    # Same columns everywhere (the check outputs): stitch the column arrays
+    # directly instead of going through concat's alignment and re-wrap
+    data = {
+        col: np.concatenate([np.asarray(g[col].values) for g in valid_gdfs])
+        for col in columns
+    }
+    data["geometry"] = gpd.GeoSeries(data["geometry"], crs=crs)
+    return gpd.GeoDataFrame(data, columns=columns, geometry="geometry", crs=crs)
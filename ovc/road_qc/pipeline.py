@@ -7,18 +7,22 @@ import geopandas as gpd
 import pandas as pd
 
 from ovc.core.logging import get_logger
-from ovc.core.crs import get_crs_pair, ensure_wgs84
+from ovc.core.crs import get_crs_pair, ensure_wgs84, to_crs
 from ovc.core.geometry import drop_empty_and_fix
 from ovc.export.geopackage import _write_layer
 from ovc.export.tables import write_metrics_csv
+from ovc.loaders.io import _READ_KWARGS, read_vector_file
 
 from ovc.road_qc.config import RoadQCConfig
+from ovc.road_qc.checks._endpoints import build_endpoint_index
 from ovc.road_qc.checks.disconnected import find_disconnected_segments
 from ovc.road_qc.checks.self_intersection import find_self_intersections
 from ovc.road_qc.checks.dangles import find_dangles
 from ovc.road_qc.metrics import compute_road_qc_metrics, merge_errors
 from ovc.road_qc.webmap import generate_road_qc_webmap
 
+_LINE_TYPES = ("LineString", "MultiLineString")
+
 
 @dataclass(frozen=True)
 class RoadQCOutputs:
@@ -34,7 +38,7 @@ class RoadQCOutputs:
 def _ensure_road_id(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """Ensure road_id column exists."""
     if "road_id" not in gdf.columns:
-        gdf = gdf.copy()
+        gdf = gdf.copy(deep=False)  # only a column is added
         if "osmid" in gdf.columns:
             gdf["road_id"] = gdf["osmid"].astype(str)
         else:
@@ -42,6 +46,11 @@ def _ensure_road_id(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     return gdf
 
 
+def _errors_to_wgs84(errors: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Project a non-empty error layer to WGS84; empty layers pass through."""
+    return errors if errors.empty else to_crs(errors, 4326)
+
+
 def run_road_qc(
     roads_path: Path | None = None,
     roads_gdf: gpd.GeoDataFrame | None = None,
@@ -66,7 +75,8 @@ def run_road_qc(
         config: Road QC configuration
 
     Returns:
-        RoadQCOutputs with paths and metrics
+        RoadQCOutputs with paths and metrics. The web map is only written
+        when at least one error is found.
     """
     log = get_logger("ovc.road_qc")
     out_dir = Path(out_dir)
@@ -77,7 +87,7 @@ def run_road_qc(
     if boundary_gdf is not None:
         boundary_4326 = ensure_wgs84(boundary_gdf)
     elif boundary_path is not None:
-        boundary_4326 = gpd.read_file(boundary_path)
+        boundary_4326 = gpd.read_file(boundary_path, **_READ_KWARGS)
         boundary_4326 = ensure_wgs84(boundary_4326)
 
     # Load roads from one of the sources
@@ -86,7 +96,7 @@ def run_road_qc(
         roads_4326 = ensure_wgs84(roads_gdf)
     elif roads_path is not None:
         log.info(f"Loading roads from {roads_path}")
-        roads_4326 = gpd.read_file(roads_path)
+        roads_4326 = read_vector_file(roads_path, _LINE_TYPES)
         roads_4326 = ensure_wgs84(roads_4326)
     else:
         raise ValueError("Must provide one of: roads_path or roads_gdf")
@@ -102,7 +112,7 @@ def run_road_qc(
             geometry="geometry",
             crs=4326,
         )
-        empty_gdf.to_file(gpkg_path, layer="errors", driver="GPKG")
+        _write_layer(gpkg_path, "errors", empty_gdf)
 
         pd.DataFrame(
             [
@@ -119,26 +129,26 @@ def run_road_qc(
         )
 
     # Filter to LineString/MultiLineString only
-    roads_4326 = roads_4326[
-        roads_4326.geometry.type.isin(["LineString", "MultiLineString"])
-    ].copy()
-    roads_4326 = drop_empty_and_fix(roads_4326)
+    roads_4326 = drop_empty_and_fix(roads_4326, _LINE_TYPES)
     roads_4326 = _ensure_road_id(roads_4326)
 
     # Project to metric CRS for accurate distance calculations
     crs_pair = get_crs_pair(roads_4326)
-    roads_metric = roads_4326.to_crs(crs_pair.crs_metric)
+    roads_metric = to_crs(roads_4326, crs_pair.crs_metric)
 
     # Project boundary to metric CRS if available
     boundary_metric = None
     if boundary_4326 is not None:
-        boundary_metric = boundary_4326.to_crs(crs_pair.crs_metric)
+        boundary_metric = to_crs(boundary_4326, crs_pair.crs_metric)
 
     log.info(f"Analyzing {len(roads_metric)} road segments")
 
+    # Endpoints are shared by the disconnected and dangle checks
+    endpoints = build_endpoint_index(roads_metric)
+
     # Run all checks
     log.info("Checking for disconnected segments...")
-    disconnected = find_disconnected_segments(roads_metric, config)
+    disconnected = find_disconnected_segments(roads_metric, config, endpoints)
     log.info(f"  Found {len(disconnected)} disconnected segments")
 
     log.info("Checking for self-intersections...")
@@ -146,27 +156,29 @@ def run_road_qc(
     log.info(f"  Found {len(self_intersections)} self-intersections")
 
     log.info("Checking for dangles...")
-    dangles = find_dangles(roads_metric, config, boundary_metric)
+    dangles = find_dangles(roads_metric, config, boundary_metric, endpoints)
     log.info(f"  Found {len(dangles)} dangles")
 
-    # Merge all errors
-    all_errors = merge_errors(disconnected, self_intersections, dangles)
+    # Merge all errors in WGS84 for export. Disconnected errors are whole
+    # roads, so their geometry is taken from roads_4326 instead of being
+    # projected back; only the point errors are reprojected.
+    if not disconnected.empty and roads_4326.index.is_unique:
+        disconnected_4326 = disconnected.set_geometry(
+            roads_4326.geometry.loc[disconnected.index].values, crs=roads_4326.crs
+        )
+    else:
+        disconnected_4326 = _errors_to_wgs84(disconnected)
+    all_errors_4326 = merge_errors(
+        disconnected_4326,
+        _errors_to_wgs84(self_intersections),
+        _errors_to_wgs84(dangles),
+    )
 
     # Compute metrics
-    metrics = compute_road_qc_metrics(all_errors)
+    metrics = compute_road_qc_metrics(all_errors_4326)
     log.info(f"Total errors: {metrics['total_errors']}")
     log.info(f"Top 3 errors: {metrics['top_3_errors']}")
 
-    # Convert errors to WGS84 for export
-    if not all_errors.empty:
-        all_errors_4326 = all_errors.to_crs(4326)
-    else:
-        all_errors_4326 = gpd.GeoDataFrame(
-            {"road_id": [], "error_type": [], "geometry": []},
-            geometry="geometry",
-            crs=4326,
-        )
-
     # Write GeoPackage
     _write_layer(gpkg_path, "errors", all_errors_4326)
     _write_layer(gpkg_path, "roads", roads_4326[["road_id", "geometry"]])
@@ -183,15 +195,21 @@ def run_road_qc(
         flat_metrics[f"top_{i}_count"] = count
     write_metrics_csv(metrics_csv, flat_metrics)
 
-    # Generate webmap
-    log.info("Generating web map...")
-    generate_road_qc_webmap(
-        roads_gdf=roads_4326,
-        errors_gdf=all_errors_4326,
-        boundary_gdf=boundary_4326,
-        out_path=webmap_html,
-        title="Road QC Results",
-    )
+    # Generate webmap; a clean run has no errors to show, so skip the
+    # folium render (and drop a stale map from an earlier run)
+    if metrics["total_errors"] == 0:
+        log.info("No errors found, skipping web map")
+        webmap_html.unlink(missing_ok=True)
+    else:
+        log.info("Generating web map...")
+        generate_road_qc_webmap(
+            roads_gdf=roads_4326,
+            errors_gdf=all_errors_4326,
+            boundary_gdf=boundary_4326,
+            out_path=webmap_html,
+            title="Road QC Results",
+            sidecar_min_features=config.webmap_sidecar_min_features,
+        )
 
     log.info(f"Results saved to {out_dir}")
 
@@ -4,8 +4,12 @@ from pathlib import Path
 
 import geopandas as gpd
 import folium
+import numpy as np
+import shapely
 from folium.plugins import Fullscreen
 
+from ovc.export.webmap import _feature_collection, _geojson_layer, _to_wgs84
+
 # Color scheme for road QC errors
 ROAD_QC_COLORS = {
     "disconnected_segment": "#e74c3c",  # Red
@@ -17,6 +21,59 @@ ROAD_QC_COLORS = {
 
 COPYRIGHT = "© OVC — Overlap Violation Checker"
 
+# Constant layer styles, built once instead of per feature by folium
+_STYLE_BOUNDARY = {
+    "color": ROAD_QC_COLORS["boundary"],
+    "weight": 2.5,
+    "fillOpacity": 0.02,
+}
+_STYLE_ROAD = {"color": ROAD_QC_COLORS["road"], "weight": 2, "opacity": 0.6}
+
+_POINT_TYPE_IDS = (shapely.GeometryType.POINT, shapely.GeometryType.MULTIPOINT)
+
+# The roads layer is for reference only, so it is simplified to about a
+# metre (in degrees) before being embedded; dense vertices below that add
+# page size without being visible
+ROADS_SIMPLIFY_DEG = 1e-5
+
+# Legend markup; colours and copyright are fixed, so only {title} is
+# filled in per map
+_LEGEND_TEMPLATE = f"""
+    <div style="
+        position: fixed;
+        bottom: 30px;
+        left: 30px;
+        z-index: 1000;
+        background-color: white;
+        padding: 15px;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+        font-family: Arial, sans-serif;
+        font-size: 13px;
+        max-width: 220px;
+    ">
+        <div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">{{title}}</div>
+        <div style="margin-bottom: 6px;">
+            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['road']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
+            Roads (reference)
+        </div>
+        <div style="margin-bottom: 6px;">
+            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['disconnected_segment']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
+            Disconnected Segment
+        </div>
+        <div style="margin-bottom: 6px;">
+            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['self_intersection']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
+            Self Intersection
+        </div>
+        <div style="margin-bottom: 6px;">
+            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['dangle']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
+            Dangle (dead end)
+        </div>
+        <hr style="margin: 10px 0; border: none; border-top: 1px solid #e5e7eb;">
+        <div style="font-size: 11px; color: #6b7280;">{COPYRIGHT}</div>
+    </div>
+    """
+
 
 def _style_error(feature, error_type: str):
     """Return style dict for error features."""
@@ -45,6 +102,7 @@ def generate_road_qc_webmap(
     out_path: Path,
     boundary_gdf: gpd.GeoDataFrame | None = None,
     title: str = "Road QC Results",
+    sidecar_min_features: int | None = None,
 ) -> Path:
     """
     Generate an interactive web map showing road QC results.
@@ -55,17 +113,19 @@ def generate_road_qc_webmap(
         out_path: Output path for HTML file
         boundary_gdf: Optional boundary GeoDataFrame
         title: Map title
+        sidecar_min_features: Write road and error layers with at least this
+            many features as GeoJSON files next to the HTML instead of
+            embedding them (the map must then be served over HTTP); None
+            keeps the map self-contained
 
     Returns:
         Path to generated HTML file
     """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
     # Ensure WGS84
     if roads_gdf is not None and not roads_gdf.empty:
-        roads_4326 = (
-            roads_gdf.to_crs(4326)
-            if (roads_gdf.crs is not None and roads_gdf.crs.to_epsg() != 4326)
-            else roads_gdf
-        )
+        roads_4326 = _to_wgs84(roads_gdf)
         bounds = roads_4326.total_bounds  # [minx, miny, maxx, maxy]
         center = [
             (bounds[1] + bounds[3]) / 2,  # lat
@@ -75,11 +135,7 @@ def generate_road_qc_webmap(
         center = [30.0, 31.0]  # Default: Egypt
 
     if errors_gdf is not None and not errors_gdf.empty:
-        errors_4326 = (
-            errors_gdf.to_crs(4326)
-            if (errors_gdf.crs is not None and errors_gdf.crs.to_epsg() != 4326)
-            else errors_gdf
-        )
+        errors_4326 = _to_wgs84(errors_gdf)
     else:
         errors_4326 = gpd.GeoDataFrame(
             {"road_id": [], "error_type": [], "geometry": []},
@@ -93,35 +149,33 @@ def generate_road_qc_webmap(
 
     # Add boundary layer if provided
     if boundary_gdf is not None and not boundary_gdf.empty:
-        boundary_4326 = (
-            boundary_gdf.to_crs(4326)
-            if (boundary_gdf.crs is not None and boundary_gdf.crs.to_epsg() != 4326)
-            else boundary_gdf
-        )
+        boundary_4326 = _to_wgs84(boundary_gdf)
         folium.GeoJson(
-            boundary_4326,
+            _feature_collection(boundary_4326),
             name="Boundary",
-            style_function=lambda x: {
-                "color": ROAD_QC_COLORS["boundary"],
-                "weight": 2.5,
-                "fillOpacity": 0.02,
-            },
+            style_function=lambda x: _STYLE_BOUNDARY,
         ).add_to(m)
 
     # Add roads layer (reference)
     if roads_gdf is not None and not roads_gdf.empty:
         roads_layer = folium.FeatureGroup(name="Roads (reference)", show=True)
-        folium.GeoJson(
-            (
-                roads_4326[["road_id", "geometry"]]
-                if "road_id" in roads_4326.columns
-                else roads_4326[["geometry"]]
+        roads_display = roads_4326[
+            ["road_id", "geometry"] if "road_id" in roads_4326.columns else ["geometry"]
+        ]
+        roads_display = roads_display.set_geometry(
+            shapely.simplify(
+                roads_display.geometry.values,
+                ROADS_SIMPLIFY_DEG,
+                preserve_topology=False,
             ),
-            style_function=lambda x: {
-                "color": ROAD_QC_COLORS["road"],
-                "weight": 2,
-                "opacity": 0.6,
-            },
+            crs=roads_display.crs,
+        )
+        _geojson_layer(
+            roads_display,
+            out_path,
+            "roads",
+            sidecar_min_features,
+            style_function=lambda x: _STYLE_ROAD,
             tooltip=folium.GeoJsonTooltip(
                 fields=["road_id"] if "road_id" in roads_4326.columns else [],
                 aliases=["Road ID"] if "road_id" in roads_4326.columns else [],
@@ -131,32 +185,53 @@ def generate_road_qc_webmap(
 
     # Add error layers by type
     if not errors_4326.empty and "error_type" in errors_4326.columns:
-        error_types = errors_4326["error_type"].unique()
-
-        for error_type in error_types:
-            error_subset = errors_4326[errors_4326["error_type"] == error_type]
+        # One hash pass over error_type, in first-appearance order, instead
+        # of a boolean mask per type
+        for error_type, error_subset in errors_4326.groupby("error_type", sort=False):
             layer = folium.FeatureGroup(
                 name=f"{error_type.replace('_', ' ').title()} ({len(error_subset)})"
             )
 
-            # Check if points or lines
-            geom_types = error_subset.geometry.type.unique()
-
-            if "Point" in geom_types or "MultiPoint" in geom_types:
-                # Add as circle markers
-                for _, row in error_subset.iterrows():
-                    geom = row.geometry
-                    if geom.geom_type == "Point":
-                        folium.CircleMarker(
-                            location=[geom.y, geom.x],
-                            popup=f"Road: {row.get('road_id', 'N/A')}<br>Error: {error_type}",
-                            **_point_style(error_type),
-                        ).add_to(layer)
+            # Check if points or lines, on integer type ids rather than
+            # per-geometry type name strings
+            type_ids = shapely.get_type_id(error_subset.geometry.values)
+
+            if np.isin(type_ids, _POINT_TYPE_IDS).any():
+                # One GeoJson layer drawn as circle markers rather than a
+                # CircleMarker object (and script block) per error
+                is_point = type_ids == shapely.GeometryType.POINT
+                points = error_subset.loc[is_point, ["geometry"]]
+                points.insert(
+                    0,
+                    "road_id",
+                    (
+                        error_subset["road_id"].to_numpy()[is_point]
+                        if "road_id" in error_subset.columns
+                        else "N/A"
+                    ),
+                )
+                points.insert(1, "error_type", error_type)
+                style = _point_style(error_type)
+                _geojson_layer(
+                    points,
+                    out_path,
+                    f"errors_{error_type}",
+                    sidecar_min_features,
+                    marker=folium.CircleMarker(radius=style["radius"]),
+                    style_function=lambda x, s=style: s,
+                    popup=folium.GeoJsonPopup(
+                        fields=["road_id", "error_type"],
+                        aliases=["Road:", "Error:"],
+                    ),
+                ).add_to(layer)
             else:
                 # Add as GeoJson lines
-                folium.GeoJson(
+                _geojson_layer(
                     error_subset[["road_id", "error_type", "geometry"]],
-                    style_function=lambda x, et=error_type: _style_error(x, et),
+                    out_path,
+                    f"errors_{error_type}",
+                    sidecar_min_features,
+                    style_function=lambda x, s=_style_error(None, error_type): s,
                     tooltip=folium.GeoJsonTooltip(
                         fields=["road_id", "error_type"],
                         aliases=["Road ID", "Error Type"],
@@ -166,48 +241,13 @@ def generate_road_qc_webmap(
             layer.add_to(m)
 
     # Add legend with copyright
-    legend_html = f"""
-    <div style="
-        position: fixed;
-        bottom: 30px;
-        left: 30px;
-        z-index: 1000;
-        background-color: white;
-        padding: 15px;
-        border-radius: 8px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        font-family: Arial, sans-serif;
-        font-size: 13px;
-        max-width: 220px;
-    ">
-        <div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">{title}</div>
-        <div style="margin-bottom: 6px;">
-            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['road']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
-            Roads (reference)
-        </div>
-        <div style="margin-bottom: 6px;">
-            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['disconnected_segment']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
-            Disconnected Segment
-        </div>
-        <div style="margin-bottom: 6px;">
-            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['self_intersection']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
-            Self Intersection
-        </div>
-        <div style="margin-bottom: 6px;">
-            <span style="display: inline-block; width: 18px; height: 18px; background: {ROAD_QC_COLORS['dangle']}; margin-right: 8px; vertical-align: middle; border-radius: 2px;"></span>
-            Dangle (dead end)
-        </div>
-        <hr style="margin: 10px 0; border: none; border-top: 1px solid #e5e7eb;">
-        <div style="font-size: 11px; color: #6b7280;">{COPYRIGHT}</div>
-    </div>
-    """
+    legend_html = _LEGEND_TEMPLATE.format(title=title)
     m.get_root().html.add_child(folium.Element(legend_html))
 
     # Add layer control
     folium.LayerControl(collapsed=False).add_to(m)
 
     # Save
-    out_path.parent.mkdir(parents=True, exist_ok=True)
     m.save(str(out_path))
 
     return out_path
@@ -5,15 +5,11 @@ import sys
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from ovc.export.pipeline import run_pipeline
-from ovc.core.logging import get_logger
+# GeoPandas, folium and the pipelines are imported only once the arguments
+# have parsed, so --help and usage errors return without paying for them.
 
-logger = get_logger("ovc.cli")
-
-
-def main():
-    logger.info("OVC started. Preparing your data...")
 
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="OVC – Spatial Data Quality Control (local data only)"
     )
@@ -73,7 +69,50 @@ def main():
         help="Output directory (default: outputs)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _run_road_qc(roads_path, boundary_path, out_dir: Path, logger, message: str):
+    from ovc.road_qc import run_road_qc
+
+    logger.info(message)
+    road_qc_outputs = run_road_qc(
+        roads_path=roads_path,
+        boundary_path=boundary_path,
+        out_dir=out_dir,
+    )
+
+    logger.info("Road QC finished")
+    logger.info(f"GeoPackage: {road_qc_outputs.gpkg_path}")
+    logger.info(f"Metrics CSV: {road_qc_outputs.metrics_csv}")
+    if road_qc_outputs.webmap_html.exists():
+        logger.info(f"Web map: {road_qc_outputs.webmap_html}")
+    logger.info(f"Total errors: {road_qc_outputs.total_errors}")
+    if road_qc_outputs.top_3_errors:
+        logger.info("Top 3 errors:")
+        for error_type, count in road_qc_outputs.top_3_errors:
+            logger.info(f"  • {error_type}: {count}")
+
+
+def main():
+    args = build_parser().parse_args()
+
+    import geopandas
+
+    from ovc.core.logging import get_logger
+
+    logger = get_logger("ovc.cli")
+
+    # Any read_file call without an explicit engine (e.g. inside geoqa's
+    # prechecks) should use pyogrio too when it is installed.
+    try:
+        import pyogrio  # noqa: F401
+
+        geopandas.options.io_engine = "pyogrio"
+    except ImportError:
+        pass
+
+    logger.info("OVC started. Preparing your data...")
 
     buildings_path = None
     if args.buildings:
@@ -105,24 +144,13 @@ def main():
             logger.error("--road-qc-only requires --roads to be provided.")
             sys.exit(1)
 
-        from ovc.road_qc import run_road_qc
-
-        logger.info("Running Road QC checks (road-qc-only mode)...")
-        road_qc_outputs = run_road_qc(
-            roads_path=roads_path,
-            boundary_path=boundary_path,
-            out_dir=Path(args.out) / "road_qc",
+        _run_road_qc(
+            roads_path,
+            boundary_path,
+            Path(args.out) / "road_qc",
+            logger,
+            "Running Road QC checks (road-qc-only mode)...",
         )
-
-        logger.info("Road QC finished")
-        logger.info(f"GeoPackage: {road_qc_outputs.gpkg_path}")
-        logger.info(f"Metrics CSV: {road_qc_outputs.metrics_csv}")
-        logger.info(f"Web map: {road_qc_outputs.webmap_html}")
-        logger.info(f"Total errors: {road_qc_outputs.total_errors}")
-        if road_qc_outputs.top_3_errors:
-            logger.info("Top 3 errors:")
-            for error_type, count in road_qc_outputs.top_3_errors:
-                logger.info(f"  • {error_type}: {count}")
         return
 
     # --- Pre-check (if requested) ---
@@ -161,6 +189,8 @@ def main():
         logger.error("--buildings is required (unless using --road-qc-only).")
         sys.exit(1)
 
+    from ovc.export.pipeline import run_pipeline
+
     logger.info("Running Building QC pipeline...")
     outputs = run_pipeline(
         buildings_path=buildings_path,
@@ -180,25 +210,14 @@ def main():
             logger.error("Road QC requires --roads to be provided.")
             sys.exit(1)
 
-        from ovc.road_qc import run_road_qc
-
-        logger.info("Running Road QC checks...")
-        road_qc_outputs = run_road_qc(
-            roads_path=roads_path,
-            boundary_path=boundary_path,
-            out_dir=Path(args.out) / "road_qc",
+        _run_road_qc(
+            roads_path,
+            boundary_path,
+            Path(args.out) / "road_qc",
+            logger,
+            "Running Road QC checks...",
         )
 
-        logger.info("Road QC finished")
-        logger.info(f"GeoPackage: {road_qc_outputs.gpkg_path}")
-        logger.info(f"Metrics CSV: {road_qc_outputs.metrics_csv}")
-        logger.info(f"Web map: {road_qc_outputs.webmap_html}")
-        logger.info(f"Total errors: {road_qc_outputs.total_errors}")
-        if road_qc_outputs.top_3_errors:
-            logger.info("Top 3 errors:")
-            for error_type, count in road_qc_outputs.top_3_errors:
-                logger.info(f"  • {error_type}: {count}")
-
 
 if __name__ == "__main__":
     main()
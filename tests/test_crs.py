@@ -2,9 +2,10 @@
 
 import geopandas as gpd
 import pytest
-from shapely.geometry import Point, Polygon
+import shapely
+from shapely.geometry import LineString, Point, Polygon
 
-from ovc.core.crs import choose_utm_crs_from_gdf, ensure_wgs84, get_crs_pair
+from ovc.core.crs import choose_utm_crs_from_gdf, ensure_wgs84, get_crs_pair, to_crs
 
 
 class TestEnsureWgs84:
@@ -41,6 +42,7 @@ class TestEnsureWgs84:
         result = ensure_wgs84(gdf)
         assert result.crs.to_epsg() == 4326
         assert float(result.geometry.iloc[0].x) == pytest.approx(31.0, abs=1e-6)
+        assert result is gdf
 
     def test_web_mercator_reprojected(self):
         """EPSG:3857 (Web Mercator) should be reprojected to 4326."""
@@ -65,6 +67,32 @@ class TestChooseUtmCrs:
         utm = choose_utm_crs_from_gdf(gdf)
         assert utm.to_epsg() == 32636
 
+    def test_area_weighted_centre(self):
+        """A large polygon outweighs a small one across a zone boundary."""
+        gdf = gpd.GeoDataFrame(
+            geometry=[
+                Polygon([(29, 30), (29.9, 30), (29.9, 31), (29, 31)]),
+                Polygon([(30.1, 30), (30.2, 30), (30.2, 30.1), (30.1, 30.1)]),
+            ],
+            crs="EPSG:4326",
+        )
+        utm = choose_utm_crs_from_gdf(gdf)
+        assert utm.to_epsg() == 32635
+
+    def test_length_weighted_centre_for_lines(self):
+        """A long road outweighs many short stubs, as in the union centroid."""
+        road = LineString([(32.5, 30.0), (34.5, 30.0)])
+        stubs = [LineString([(29.5, 30.0), (29.5001, 30.0)]) for _ in range(10)]
+        gdf = gpd.GeoDataFrame(geometry=[road, *stubs], crs="EPSG:4326")
+        utm = choose_utm_crs_from_gdf(gdf)
+        assert utm.to_epsg() == 32636
+
+    def test_zone_crs_is_reused(self):
+        """Repeated calls for the same zone return the cached CRS object."""
+        a = gpd.GeoDataFrame(geometry=[Point(31.2, 30.0)], crs="EPSG:4326")
+        b = gpd.GeoDataFrame(geometry=[Point(32.5, 29.0)], crs="EPSG:4326")
+        assert choose_utm_crs_from_gdf(a) is choose_utm_crs_from_gdf(b)
+
     def test_empty_gdf_fallback(self):
         """Empty GDF should return Web Mercator fallback."""
         gdf = gpd.GeoDataFrame(geometry=[], crs="EPSG:4326")
@@ -97,3 +125,43 @@ class TestGetCrsPair:
         )
         with pytest.raises(ValueError, match="no CRS defined"):
             get_crs_pair(gdf)
+
+
+class TestToCrs:
+    """Tests for the batched to_crs helper."""
+
+    def test_matches_geopandas(self):
+        gdf = gpd.GeoDataFrame(
+            {"val": [1, 2, 3]},
+            geometry=[
+                Polygon([(31, 30), (31.1, 30), (31.1, 30.1), (31, 30.1)]),
+                Point(31.2, 30.2),
+                None,
+            ],
+            crs="EPSG:4326",
+        )
+        expected = gdf.to_crs(32636)
+        result = to_crs(gdf, 32636)
+        assert result.crs == expected.crs
+        assert result["val"].tolist() == [1, 2, 3]
+        assert result.geometry.iloc[2] is None
+        assert shapely.equals_exact(
+            result.geometry.values[:2], expected.geometry.values[:2], 0
+        ).all()
+
+    def test_3d_matches_geopandas(self):
+        gdf = gpd.GeoDataFrame(
+            geometry=[Point(31.2, 30.2, 15.0), Point(31.3, 30.1, 20.0)],
+            crs="EPSG:4326",
+        )
+        expected = gdf.to_crs(32636)
+        result = to_crs(gdf, 32636)
+        assert shapely.has_z(result.geometry.values).all()
+        assert shapely.equals_exact(
+            result.geometry.values, expected.geometry.values, 1e-6
+        ).all()
+
+    def test_raises_on_no_crs(self):
+        gdf = gpd.GeoDataFrame(geometry=[Point(0, 0)])
+        with pytest.raises(ValueError):
+            to_crs(gdf, 4326)
@@ -0,0 +1,66 @@
+import geopandas as gpd
+import pandas as pd
+from shapely.geometry import LineString, Point, Polygon
+from ovc.core.geometry import (
+    clip_to_boundary,
+    drop_empty_and_fix,
+    renumber_rows,
+    union_boundary,
+)
+
+BOUNDARY = gpd.GeoDataFrame(
+    geometry=[
+        Polygon([(0, 0), (5, 0), (5, 10), (0, 10)]),
+        Polygon([(5, 0), (10, 0), (10, 10), (5, 10)]),
+    ],
+    crs=4326,
+)
+
+
+def test_union_boundary_dissolves_shared_edges():
+    union = union_boundary(BOUNDARY)
+    assert union.geom_type == "Polygon"
+    assert union.area == 100
+
+
+def test_clip_to_boundary():
+    roads = gpd.GeoDataFrame(
+        {"osmid": ["inside", "crossing", "outside"]},
+        geometry=[
+            LineString([(1, 1), (2, 2)]),
+            LineString([(5, 5), (15, 5)]),
+            LineString([(20, 20), (30, 30)]),
+        ],
+        crs=4326,
+    )
+    out = clip_to_boundary(roads, BOUNDARY)
+    assert list(out["osmid"]) == ["inside", "crossing"]
+    # features inside the boundary are kept as they are
+    assert out.geometry.iloc[0].equals_exact(roads.geometry.iloc[0], 0)
+    assert out.geometry.iloc[1].length == 5
+
+
+def test_drop_empty_and_fix_filters_types_and_repairs():
+    gdf = gpd.GeoDataFrame(
+        {"id": [0, 1, 2, 3, 4]},
+        geometry=[
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+            Polygon([(0, 0), (1, 1), (1, 0), (0, 1)]),  # bow-tie
+            Point(0, 0),
+            Polygon(),
+            None,
+        ],
+        crs=4326,
+    )
+    out = drop_empty_and_fix(gdf, ("Polygon", "MultiPolygon"))
+    assert list(out["id"]) == [0, 1]
+    assert out.geometry.is_valid.all()
+    assert out.geometry.iloc[0].equals_exact(gdf.geometry.iloc[0], 0)
+
+
+def test_renumber_rows_matches_reset_index():
+    gdf = BOUNDARY.iloc[[1, 0]]
+    expected = gdf.reset_index(drop=True)
+    out = renumber_rows(gdf.copy())
+    assert isinstance(out.index, pd.RangeIndex)
+    assert out.equals(expected)
@@ -11,6 +11,7 @@ from ovc.checks.geometry_quality import (
     find_unreasonable_areas,
     compute_compactness,
     find_min_road_distance_violations,
+    run_geometry_quality_checks,
 )
 
 # ── Duplicate geometry tests ──────────────────────────────────
@@ -162,6 +163,44 @@ def test_building_too_close_to_road():
     assert len(result) == 1  # Building is 1m from road, threshold is 3m
 
 
+def test_road_distance_is_to_nearest_road():
+    bldg = Polygon([(1, 0), (3, 0), (3, 2), (1, 2)])
+    buildings = gpd.GeoDataFrame({"bldg_id": [0]}, geometry=[bldg], crs=3857)
+    roads = gpd.GeoDataFrame(
+        geometry=[LineString([(5, 0), (5, 10)]), LineString([(0, 0), (0, 10)])],
+        crs=3857,
+    )
+    result = find_min_road_distance_violations(buildings, roads, min_distance_m=3.0)
+    assert len(result) == 1
+    assert result.iloc[0]["min_road_dist_m"] == pytest.approx(1.0)
+
+
+def test_road_distance_fallback_without_dwithin(monkeypatch):
+    """GEOS builds without dwithin query with buffered roads instead."""
+    monkeypatch.setattr("shapely.geos_version", (3, 9, 0))
+    bldgs = [
+        Polygon([(2, 0), (4, 0), (4, 2), (2, 2)]),
+        Polygon([(20, 0), (22, 0), (22, 2), (20, 2)]),
+    ]
+    buildings = gpd.GeoDataFrame({"bldg_id": [0, 1]}, geometry=bldgs, crs=3857)
+    roads = gpd.GeoDataFrame(geometry=[LineString([(0, 0), (0, 10)])], crs=3857)
+    result = find_min_road_distance_violations(buildings, roads, min_distance_m=3.0)
+    assert list(result["bldg_id"]) == [0]
+
+
+def test_road_distance_fallback_is_to_nearest_road(monkeypatch):
+    """The buffered fallback pairs still give the nearest-road distance."""
+    monkeypatch.setattr("shapely.geos_version", (3, 9, 0))
+    bldg = Polygon([(1, 0), (3, 0), (3, 2), (1, 2)])
+    buildings = gpd.GeoDataFrame({"bldg_id": [0]}, geometry=[bldg], crs=3857)
+    roads = gpd.GeoDataFrame(
+        geometry=[LineString([(5, 0), (5, 10)]), LineString([(0, 0), (0, 10)])],
+        crs=3857,
+    )
+    result = find_min_road_distance_violations(buildings, roads, min_distance_m=3.0)
+    assert result.iloc[0]["min_road_dist_m"] == pytest.approx(1.0)
+
+
 def test_building_far_from_road():
     bldg = Polygon([(50, 0), (60, 0), (60, 10), (50, 10)])
     road = LineString([(0, 0), (0, 10)])
@@ -193,3 +232,45 @@ def test_empty_roads_distance():
         gpd.GeoDataFrame(geometry=[], crs=3857),
     )
     assert len(result) == 0
+
+
+# ── Orchestrator tests ────────────────────────────────────────
+
+
+def test_run_geometry_quality_checks_matches_individual_checks():
+    buildings = gpd.GeoDataFrame(
+        {"bldg_id": [0, 1, 2, 3]},
+        geometry=[
+            Polygon([(1, 0), (3, 0), (3, 2), (1, 2)]),
+            Polygon([(1, 0), (3, 0), (3, 2), (1, 2)]),
+            Polygon([(50, 0), (150, 0), (150, 0.5), (50, 0.5)]),
+            Polygon([(60, 60), (70, 70), (70, 60), (60, 70)]),
+        ],
+        crs=3857,
+    )
+    roads = gpd.GeoDataFrame(geometry=[LineString([(0, 0), (0, 10)])], crs=3857)
+
+    results = run_geometry_quality_checks(buildings, roads)
+
+    assert set(results) == {
+        "duplicate_geometry",
+        "invalid_geometry",
+        "unreasonable_area",
+        "low_compactness",
+        "road_setback_violation",
+    }
+    assert set(results["duplicate_geometry"]["bldg_id"]) == {0, 1}
+    assert list(results["invalid_geometry"]["bldg_id"]) == [3]
+    assert len(results["low_compactness"]) == len(compute_compactness(buildings))
+    assert set(results["road_setback_violation"]["bldg_id"]) == {0, 1}
+
+
+def test_run_geometry_quality_checks_without_roads():
+    gdf = gpd.GeoDataFrame(
+        {"bldg_id": [0]},
+        geometry=[Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])],
+        crs=3857,
+    )
+    results = run_geometry_quality_checks(gdf)
+    assert "road_setback_violation" not in results
+    assert all(len(r) == 0 for r in results.values())
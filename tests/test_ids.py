@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ovc.core.ids import as_str_ids
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series([101, 202, 303]),
+        pd.Series([1.5, np.nan]),
+        pd.Series(["a", None]),
+        pd.Series([1, None], dtype="Int64"),
+        pd.Series(["a", None], dtype="string"),
+        pd.Index(pd.array([7, None], dtype="Int64")),
+    ],
+)
+def test_as_str_ids_matches_astype_str(values):
+    out = as_str_ids(values)
+    assert out.dtype == object
+    assert list(out) == list(values.astype(str))
+
+
+def test_as_str_ids_nullable_int():
+    out = as_str_ids(pd.Series([1, None], dtype="Int64"))
+    assert list(out) == ["1", "<NA>"]
@@ -48,3 +48,73 @@ def test_no_overlap():
     )
     ov = find_building_overlaps(gdf, THRESHOLDS)
     assert len(ov) == 0
+
+
+def test_overlap_multipart_keeps_largest_part():
+    """A U-shaped building crossing a bar yields two parts; keep the largest."""
+    gdf = gpd.GeoDataFrame(
+        {"bldg_id": [0, 1]},
+        geometry=[
+            Polygon(
+                [(0, 0), (10, 0), (10, 10), (8, 10), (8, 2), (2, 2), (2, 10), (0, 10)]
+            ),
+            Polygon([(-1, 5), (11, 5), (11, 8), (-1, 8)]),
+        ],
+        crs=3857,
+    )
+    ov = find_building_overlaps(gdf, THRESHOLDS)
+    assert len(ov) == 1
+    assert ov.iloc[0].geometry.geom_type == "Polygon"
+    assert ov.iloc[0]["inter_area_m2"] == 6.0
+
+
+def test_overlap_accepts_prebuilt_sindex():
+    """A shared spatial index gives the same result as building one."""
+    gdf = gpd.GeoDataFrame(
+        {"bldg_id": [0, 1, 2]},
+        geometry=[
+            Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]),
+            Polygon([(1, 1), (3, 1), (3, 3), (1, 3)]),
+            Polygon([(10, 10), (12, 10), (12, 12), (10, 12)]),
+        ],
+        crs=3857,
+    )
+    shared = find_building_overlaps(gdf, THRESHOLDS, sindex=gdf.sindex)
+    fresh = find_building_overlaps(gdf.copy(), THRESHOLDS)
+    assert shared[["bldg_a", "bldg_b"]].values.tolist() == [[0, 1]]
+    assert fresh[["bldg_a", "bldg_b"]].values.tolist() == [[0, 1]]
+
+
+def test_overlap_duplicate_only_mode():
+    gdf = gpd.GeoDataFrame(
+        {"bldg_id": [0, 1, 2]},
+        geometry=[
+            Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]),
+            Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]),
+            Polygon([(1, 1), (3, 1), (3, 3), (1, 3)]),
+        ],
+        crs=3857,
+    )
+    full = find_building_overlaps(gdf, THRESHOLDS)
+    dups = find_building_overlaps(gdf, THRESHOLDS, mode="duplicate_only")
+    assert set(full["overlap_type"]) == {"duplicate", "partial"}
+    assert dups[["bldg_a", "bldg_b"]].values.tolist() == [[0, 1]]
+    assert (dups["overlap_type"] == "duplicate").all()
+
+
+def test_overlap_duplicate_groups_expand_to_all_pairs():
+    square = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    gdf = gpd.GeoDataFrame(
+        {"bldg_id": [10, 11, 12, 13]},
+        geometry=[square, Polygon([(1, 1), (3, 1), (3, 3), (1, 3)]), square, square],
+        crs=3857,
+    )
+    ov = find_building_overlaps(gdf, THRESHOLDS)
+    pairs = ov[["bldg_a", "bldg_b"]].values.tolist()
+    assert pairs == [[10, 11], [10, 12], [10, 13], [11, 12], [11, 13], [12, 13]]
+    dup = ov["overlap_type"] == "duplicate"
+    assert ov.loc[dup, ["bldg_a", "bldg_b"]].values.tolist() == [
+        [10, 12],
+        [10, 13],
+        [12, 13],
+    ]
@@ -1,7 +1,14 @@
+import json
+from dataclasses import replace
 from pathlib import Path
 
+import geopandas as gpd
+import numpy as np
+from shapely.geometry import LineString, Point
+
 from ovc.export.pipeline import run_pipeline
-from ovc.core.config import DEFAULT_CONFIG
+from ovc.export.webmap import _feature_collection
+from ovc.core.config import DEFAULT_CONFIG, WebMapConfig
 
 TESTS_DIR = Path(__file__).parent
 BOUNDARY = TESTS_DIR / "data" / "sample_boundary.geojson"
@@ -63,3 +70,34 @@ def test_pipeline_full(tmp_path):
     assert outputs.gpkg_path.exists()
     assert outputs.metrics_csv.exists()
     assert outputs.webmap_html.exists()
+
+
+def test_pipeline_webmap_sidecar_layers(tmp_path):
+    """Large layers are written next to the map and linked, not embedded."""
+    out_dir = tmp_path / "outputs"
+    config = replace(DEFAULT_CONFIG, webmap=WebMapConfig(sidecar_min_features=1))
+    outputs = run_pipeline(
+        buildings_path=BUILDINGS,
+        roads_path=ROADS,
+        out_dir=out_dir,
+        config=config,
+    )
+    html = outputs.webmap_html.read_text(encoding="utf-8")
+    sidecar = outputs.webmap_html.with_name(f"{outputs.webmap_html.stem}_roads.geojson")
+    assert sidecar.exists()
+    assert f'"{sidecar.name}"' in html
+
+
+def test_feature_collection_matches_geo_interface():
+    """The column-wise GeoJSON matches GeoPandas' own, minus the bboxes."""
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["a", "b", "c"], "length": [1.5, np.nan, 3.0]},
+        geometry=[Point(31.2, 30.0), LineString([(31.2, 30.0), (31.3, 30.1)]), None],
+        crs=4326,
+    )
+    # folium round-trips the interface through json, turning tuples to lists
+    expected = json.loads(json.dumps(gdf.__geo_interface__))
+    for feature in expected["features"]:
+        feature.pop("bbox", None)
+    expected.pop("bbox", None)
+    assert _feature_collection(gdf) == expected
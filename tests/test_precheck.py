@@ -112,6 +112,23 @@ class TestPrecheckBuildings:
         assert result.is_ready is False
         assert any("CRS" in b for b in result.blockers)
 
+    def test_large_dataset_topology_sampled(self, buildings_shp, tmp_path, monkeypatch):
+        """Datasets over the topology limit are checked on a sample."""
+        monkeypatch.setattr("ovc.precheck.runner.TOPOLOGY_MAX_FEATURES", 2)
+        result = _run_geoqa_profile(buildings_shp, "buildings")
+        assert result.feature_count == 3
+        assert any("sample" in w for w in result.warnings)
+
+    def test_pre_read_matches_path_profile(self, buildings_shp, monkeypatch):
+        """Reading the frame first reports what profiling the path does."""
+        pre_read = _run_geoqa_profile(buildings_shp, "buildings")
+        monkeypatch.setattr("ovc.precheck.runner._READ_KWARGS", {})
+        from_path = _run_geoqa_profile(buildings_shp, "buildings")
+        assert pre_read == from_path
+        assert pre_read.source_path == buildings_shp
+        assert pre_read.feature_count == 3
+        assert pre_read.column_count == from_path.column_count
+
 
 class TestPrecheckRoads:
     def test_valid_roads(self, roads_shp, tmp_path):
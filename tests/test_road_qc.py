@@ -1,12 +1,16 @@
+import math
+
 import geopandas as gpd
 import pytest
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString, MultiLineString, Point
 
 from ovc.road_qc.config import RoadQCConfig
 from ovc.road_qc.checks.disconnected import find_disconnected_segments
 from ovc.road_qc.checks.self_intersection import find_self_intersections
 from ovc.road_qc.checks.dangles import find_dangles
+from ovc.road_qc.checks._endpoints import build_endpoint_index
 from ovc.road_qc.metrics import compute_road_qc_metrics, merge_errors
+from ovc.road_qc.pipeline import run_road_qc
 
 CONFIG = RoadQCConfig()
 
@@ -37,6 +41,41 @@ def test_connected_roads():
     assert len(result) == 0
 
 
+def test_connected_roads_diagonal_gap_within_tolerance():
+    """Endpoints just inside the tolerance connect regardless of direction."""
+    tol = CONFIG.disconnect_tolerance_m
+    # between the vertices of a buffered-endpoint polygon, where a
+    # polygon-based test would miss it
+    angle = math.pi / 64
+    dx, dy = tol * 0.9995 * math.cos(angle), tol * 0.9995 * math.sin(angle)
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2"]},
+        geometry=[
+            LineString([(0, 0), (10, 0)]),
+            LineString([(10 + dx, dy), (20, 10)]),
+        ],
+        crs=3857,
+    )
+    result = find_disconnected_segments(gdf, CONFIG)
+    assert len(result) == 0
+
+
+def test_disconnected_buffer_fallback_without_dwithin(monkeypatch):
+    """GEOS builds without dwithin fall back to buffered endpoints."""
+    monkeypatch.setattr("shapely.geos_version", (3, 9, 0))
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2", "r3"]},
+        geometry=[
+            LineString([(0, 0), (10, 0)]),
+            LineString([(10, 0), (20, 0)]),
+            LineString([(50, 50), (60, 50)]),
+        ],
+        crs=3857,
+    )
+    result = find_disconnected_segments(gdf, CONFIG)
+    assert list(result["road_id"]) == ["r3"]
+
+
 def test_self_intersection_simple():
     """Simple line has no self-intersection."""
     gdf = gpd.GeoDataFrame(
@@ -87,6 +126,44 @@ def test_dangles_connected():
     assert len(result) == 2
 
 
+def test_dangles_multilinestring_parts():
+    """Every part of a MultiLineString contributes its own endpoints."""
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2"]},
+        geometry=[
+            MultiLineString([[(0, 0), (10, 0)], [(10, 0), (10, 10)]]),
+            LineString([(10, 10), (20, 10)]),
+        ],
+        crs=3857,
+    )
+    result = find_dangles(gdf, CONFIG)
+    assert sorted((p.x, p.y) for p in result.geometry) == [(0, 0), (20, 10)]
+    assert list(result["road_id"]) == ["r1", "r2"]
+
+
+def test_shared_endpoint_index():
+    """Checks given a prebuilt endpoint index match their standalone results."""
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2", "r3"]},
+        geometry=[
+            LineString([(0, 0), (10, 0)]),
+            LineString([(10, 0), (20, 0)]),
+            LineString([(50, 50), (60, 50)]),
+        ],
+        crs=3857,
+    )
+    endpoints = build_endpoint_index(gdf)
+    assert len(endpoints) == 6
+    assert list(endpoints.road_id) == ["r1", "r1", "r2", "r2", "r3", "r3"]
+
+    shared = find_disconnected_segments(gdf, CONFIG, endpoints)
+    assert list(shared["road_id"]) == ["r3"]
+    assert shared.equals(find_disconnected_segments(gdf, CONFIG))
+    assert find_dangles(gdf, CONFIG, endpoints=endpoints).equals(
+        find_dangles(gdf, CONFIG)
+    )
+
+
 def test_metrics_computation():
     """Metrics correctly count and rank errors."""
     errors = gpd.GeoDataFrame(
@@ -125,3 +202,51 @@ def test_merge_errors():
     )
     result = merge_errors(gdf1, gdf2)
     assert len(result) == 2
+
+
+def test_merge_errors_rejects_mixed_crs():
+    """Errors in different CRSs are not silently merged."""
+    gdf1 = gpd.GeoDataFrame(
+        {"road_id": ["r1"], "error_type": ["dangle"]},
+        geometry=[Point(0, 0)],
+        crs=3857,
+    )
+    gdf2 = gdf1.set_crs(4326, allow_override=True)
+    with pytest.raises(ValueError):
+        merge_errors(gdf1, gdf2)
+
+
+def test_run_road_qc_clean_network_skips_webmap(tmp_path):
+    """A run without errors writes the GeoPackage but no web map."""
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2"]},
+        geometry=[
+            LineString([(31.0, 30.0), (31.001, 30.0)]),
+            LineString([(31.001, 30.0), (31.0, 30.0)]),
+        ],
+        crs=4326,
+    )
+    outputs = run_road_qc(roads_gdf=gdf, out_dir=tmp_path)
+    assert outputs.total_errors == 0
+    assert outputs.gpkg_path.exists()
+    assert not outputs.webmap_html.exists()
+
+
+def test_run_road_qc_webmap_sidecar_layers(tmp_path):
+    """Large road QC layers are written next to the map and linked."""
+    gdf = gpd.GeoDataFrame(
+        {"road_id": ["r1", "r2"]},
+        geometry=[
+            LineString([(31.0, 30.0), (31.001, 30.0)]),
+            LineString([(31.01, 30.01), (31.011, 30.01)]),
+        ],
+        crs=4326,
+    )
+    config = RoadQCConfig(webmap_sidecar_min_features=1)
+    outputs = run_road_qc(roads_gdf=gdf, out_dir=tmp_path, config=config)
+    html = outputs.webmap_html.read_text(encoding="utf-8")
+    stem = outputs.webmap_html.stem
+    for slug in ("roads", "errors_disconnected_segment", "errors_dangle"):
+        sidecar = outputs.webmap_html.with_name(f"{stem}_{slug}.geojson")
+        assert sidecar.exists()
+        assert f'"{sidecar.name}"' in html